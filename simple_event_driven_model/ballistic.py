@@ -6,10 +6,11 @@ Module:
 Description:
     This file holds the Ballistic class which is a simple Physics 101
     example of ballistic motion of an object with an initial state
-    (position, velocity, and acceleration).
+    (position, velocity, and acceleration). It also holds the BallisticBatch
+    class which steps many Ballistic objects at once.
 
 Usage:
-    from simple_event_driven_model.ballistic import Ballistic
+    from simple_event_driven_model.ballistic import Ballistic, BallisticBatch
 
     golf_ball = Ballistic(
         initial_state=State(
@@ -31,6 +32,9 @@ Usage:
         )
     )
 
+    golf_balls = BallisticBatch(ballistics=[golf_ball])
+    golf_balls.dynamics(timestep=0.01, time=0.01)
+
 Notes:
 
 
@@ -54,27 +58,88 @@ TODOs:
 import numpy as np
 import pandas as pd
 
+# Numba is optional. If it isn't installed the numpy versions of the kernels
+# below are used instead.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Custom Package Imports
 from state import State, Cartesian
 
 
+if njit is not None:
+    # cache=True saves the compiled kernels to disk so we only pay the compile
+    # cost the first time the sim is run.
+    @njit(cache=True, fastmath=True)
+    def _step(data: np.ndarray, timestep: float):
+        # Rows of data are position, velocity, and acceleration.
+        for axis in range(3):
+            data[1, axis] += data[2, axis] * timestep
+            data[0, axis] += data[1, axis] * timestep
+
+    @njit(cache=True, fastmath=True)
+    def _step_batch(data: np.ndarray, timestep: float):
+        # data is (N, 3, 3), one state per object. This is deliberately not
+        # parallel=True; for a handful of objects the thread start up costs
+        # more than the arithmetic.
+        for index in range(data.shape[0]):
+            _step(data[index], timestep)
+
+else:
+    def _step(data: np.ndarray, timestep: float):
+        # Rows of data are position, velocity, and acceleration.
+        data[1] += data[2] * timestep
+        data[0] += data[1] * timestep
+
+    def _step_batch(data: np.ndarray, timestep: float):
+        # data is (N, 3, 3), one state per object.
+        data[:, 1] += data[:, 2] * timestep
+        data[:, 0] += data[:, 1] * timestep
+
+
 class Ballistic:
     """
     This class is the framework of the classic Physics 101
     ballistic motion.
     """
 
-    def __init__(self, initial_state: State):
+    # Number of logged states to allocate when max_steps isn't known.
+    DEFAULT_LOG_SIZE = 1024
+
+    # Columns of the states DataFrame.
+    STATE_COLUMNS = [
+        'Time [sec]',
+        'Position x [m]', 'Position y [m]', 'Position z [m]',
+        'Velocity x [m/s]', 'Velocity y [m/s]', 'Velocity z [m/s]',
+        'Acceleration x [m/s^2]', 'Acceleration y [m/s^2]', 'Acceleration z [m/s^2]',
+    ]
+
+    def __init__(self, initial_state: State, max_steps: [int, None] = None):
         """
         Instantiate the class.
 
         Args:
             initial_state:  The initial state of the object.
+            max_steps:      The maximum number of timesteps the sim will take. This
+                            is used to allocate the state log up front. If None, or
+                            if the sim runs longer, the log grows as needed.
         """
 
         self._state = initial_state
 
-        self._states = []
+        # Keep a copy of the initial conditions for the closed form solution.
+        self._initial_data = initial_state._data.copy()
+        self._initial_time = initial_state.time
+
+        # Each logged row is time followed by the 9 values of the state array. The log
+        # uses the same dtype as the state.
+        if max_steps is None:
+            max_steps = self.DEFAULT_LOG_SIZE
+
+        self._states = np.empty((max_steps + 1, 10), dtype=initial_state._data.dtype)
+        self._step_index = 0
         self.capture_state()
 
     def dynamics(self, timestep: float, time: float):
@@ -90,8 +155,8 @@ class Ballistic:
             N/A
         """
 
-        self._state.velocity = self._state.velocity + (self._state.acceleration * timestep)
-        self._state.position = self._state.position + (self._state.velocity * timestep)
+        # Update the velocity then the position in place.
+        _step(self._state._data, timestep)
         self._state.time = time
 
         # Log states for later analysis.
@@ -105,7 +170,98 @@ class Ballistic:
             N/A
         """
 
-        self._states.append(self._state.as_vector)
+        if self._step_index == self._states.shape[0]:
+            # Out of room, double the size of the log.
+            self._states = np.concatenate((self._states, np.empty_like(self._states)))
+
+        row = self._states[self._step_index]
+        row[0] = self._state.time
+        row[1:] = self._state._data.ravel()
+        self._step_index += 1
+
+    def state_at(self, time: float) -> State:
+        """
+        The exact state at a given time. The acceleration is constant so the motion
+        has a closed form solution and no timesteps are needed:
+            p(t) = p0 + v0*t + 0.5*a*t^2
+            v(t) = v0 + a*t
+
+        Args:
+            time:       The absolute sim time. [sec]
+
+        Returns:
+            State:      The state of the object at that time.
+        """
+
+        position, velocity, acceleration = self._initial_data
+        elapsed = time - self._initial_time
+
+        state = State(
+            position=position + velocity * elapsed + 0.5 * acceleration * elapsed ** 2,
+            velocity=velocity + acceleration * elapsed,
+            acceleration=acceleration,
+            dtype=self._initial_data.dtype,
+        )
+        state.time = time
+
+        return state
+
+    def trajectory(self, times: np.ndarray) -> pd.DataFrame:
+        """
+        The exact states at a set of times, computed all at once from the closed form
+        solution (see state_at).
+
+        Args:
+            times:      The absolute sim times. [sec]
+
+        Returns:
+            pd.DataFrame:   The states with the same columns as the states property.
+        """
+
+        times = np.asarray(times, dtype=np.float64)
+        elapsed = (times - self._initial_time)[:, None]
+        position, velocity, acceleration = self._initial_data
+
+        trajectory = np.empty((times.size, 10))
+        trajectory[:, 0] = times
+        trajectory[:, 1:4] = position + velocity * elapsed + 0.5 * acceleration * elapsed ** 2
+        trajectory[:, 4:7] = velocity + acceleration * elapsed
+        trajectory[:, 7:10] = acceleration
+
+        trajectory = pd.DataFrame(trajectory, columns=self.STATE_COLUMNS)
+        trajectory.set_index('Time [sec]', inplace=True)
+
+        return trajectory
+
+    def ground_impact_time(self) -> float:
+        """
+        The exact time the object reaches an altitude of 0, found by solving
+        z0 + vz0*t + 0.5*az*t^2 = 0 for the first t >= 0.
+
+        Returns:
+            float:      The absolute sim time of the impact. [sec] This is np.inf
+                        if the object never reaches the ground.
+        """
+
+        z = self._initial_data[0, 2]
+        v_z = self._initial_data[1, 2]
+        a_z = self._initial_data[2, 2]
+
+        if a_z == 0.:
+            roots = [-z / v_z] if v_z != 0. else ([0.] if z == 0. else [])
+        else:
+            discriminant = v_z ** 2 - 2. * a_z * z
+            if discriminant < 0.:
+                roots = []
+            else:
+                root = np.sqrt(discriminant)
+                roots = [(-v_z - root) / a_z, (-v_z + root) / a_z]
+
+        roots = [root for root in roots if root >= 0.]
+        if len(roots) == 0:
+            return np.inf
+
+        return self._initial_time + min(roots)
 
     @property
     def state(self) -> State:
@@ -114,14 +270,81 @@ class Ballistic:
     @property
     def states(self) -> pd.DataFrame:
         states = pd.DataFrame(
-            self._states,
-            columns=[
-                'Time [sec]',
-                'Position x [m]', 'Position y [m]', 'Position z [m]',
-                'Velocity x [m/s]', 'Velocity y [m/s]', 'Velocity z [m/s]',
-                'Acceleration x [m/s^2]', 'Acceleration y [m/s^2]', 'Acceleration z [m/s^2]',
-            ]
+            self._states[:self._step_index],
+            columns=self.STATE_COLUMNS
         )
         states.set_index('Time [sec]', inplace=True)
 
         return states
+
+
+class BallisticBatch:
+    """
+    This class steps a group of Ballistic objects together. The states of every
+    object are stacked into a single (N, 3, 3) array so one timestep is two numpy
+    operations regardless of how many objects are in the batch.
+    """
+
+    def __init__(self, ballistics: list):
+        """
+        Instantiate the class.
+
+        Args:
+            ballistics:     The Ballistic objects to be stepped together. Their states
+                            must all have the same dtype, see State.
+        """
+
+        self._ballistics = tuple(ballistics)
+
+        # np.stack would upcast mixed dtypes, e.g. float32 states would silently become
+        # float64 when their rows of the batch array are assigned back below.
+        dtypes = {ballistic.state._data.dtype for ballistic in self._ballistics}
+        if len(dtypes) > 1:
+            raise ValueError(
+                f'The states of a BallisticBatch must all have the same dtype, got {sorted(map(str, dtypes))}.'
+            )
+
+        self._data = np.stack([ballistic.state._data for ballistic in self._ballistics])
+
+        # Point each object's state at its row of the batch array. This way the
+        # objects always see the current state without copying anything back.
+        for index, ballistic in enumerate(self._ballistics):
+            ballistic.state._data = self._data[index]
+
+    def dynamics(self, timestep: float, time: float):
+        """
+        The dynamics equations for every object in the batch based on a timestep.
+
+        Args:
+            timestep:   The timestep since the last time this
+                        method was called. [sec]
+            time:       The absolute sim time. [sec]
+
+        Returns:
+            N/A
+        """
+
+        _step_batch(self._data, timestep)
+
+        # Log states for later analysis.
+        for ballistic in self._ballistics:
+            ballistic.state.time = time
+            ballistic.capture_state()
+
+    def all_above_ground(self) -> bool:
+        """
+        Check if every object in the batch is at or above an altitude of 0.
+
+        Returns:
+            bool:       True if every object has z >= 0.
+        """
+
+        return bool((self._data[:, 0, 2] >= 0.).all())
+
+    @property
+    def ballistics(self) -> tuple:
+        return self._ballistics
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
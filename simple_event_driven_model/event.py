@@ -32,11 +32,7 @@ TODOs:
 """
 
 # Standard Library Imports
-import numpy as np  # We only use np for numpy because it is what every tutorial (and therefore
-# almost everyone) uses.
-import pandas as pd
-import scipy  # We don't use an as here because most people use scipy not some abbreviation.
-
+import keyword
 
 # Custom Package Imports
 
@@ -46,18 +42,38 @@ class Event:
     A class to manage a single Event.
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, arguments: [tuple, None] = None):
         """
         Instantiate the class
 
         Args:
             name:           A descriptive name for the Event.
+            arguments:      The names of the positional args every function is
+                            called with, if the event has a fixed signature, e.g.
+                            ('timestep', 'time') for the SimClock timestep event.
+                            Only events with a fixed signature get a generated
+                            fire when locked (see _compile_fire).
         """
 
+        if arguments is not None:
+            arguments = tuple(arguments)
+            for argument in arguments:
+                if not argument.isidentifier() or keyword.iskeyword(argument):
+                    raise ValueError('{0} is not a valid argument name.'.format(argument))
+
         self.name = name
+        self._arguments = arguments
         self._functions = {}
 
+        # A snapshot of the functions used when the event fires. It is rebuilt
+        # whenever a function is added or removed.
+        self._function_tuple = ()
+
+        # True when fire has been replaced by a generated version (see _compile_fire).
+        self._compiled = False
+
         self.__iteration_counter = 0
+        self.__iteration_functions = ()
 
     def __repr__(self):
         # This function defines the display when we type an instantiated class
@@ -76,16 +92,19 @@ class Event:
     def __iter__(self):
         # This is part of what allows us to use this class in a loop like we
         # would a list.
+        # The functions are snapshotted once here rather than rebuilding the list of
+        # names on every step of the loop.
         self.__iteration_counter = 0
+        self.__iteration_functions = self._function_tuple
         return self
 
     def __next__(self):
         # This is the other part that allows us to use this class in a loop like
         # we would a list.
         try:
-            function = self.functions[self.__iteration_counter]
+            function = self.__iteration_functions[self.__iteration_counter]
             self.__iteration_counter += 1
-            return self._functions[function]
+            return function
         except IndexError:
             raise StopIteration
 
@@ -103,6 +122,9 @@ class Event:
         """
 
         self._functions[name] = function
+        self._function_tuple = tuple(self._functions.values())
+        if self._compiled is True:
+            self._compile_fire()
 
     def remove_function(self, name: str):
         """
@@ -122,27 +144,35 @@ class Event:
         except KeyError:
             raise AttributeError('{0} is not an function in this event.'.format(name))
 
-    def fire(self, **kwargs):
+        self._function_tuple = tuple(self._functions.values())
+        if self._compiled is True:
+            self._compile_fire()
+
+    def fire(self, *args, **kwargs):
         """
         This is the heart of any event driven architecture. This
         executes the events.
 
         Args:
+            *args:      Positional input args passed, in order, to every
+                        function. Events with a fixed signature, like the
+                        SimClock timestep event, should use these because
+                        they avoid building a dict for every call.
             **kwargs:   This class is a generic handler for events as
                         such it needs to handle whatever set of input
-                        arguments any event may need. So we use
+                        arguments any event may need. So we also accept
                         **kwargs.
 
         Example:
-        def execute(**kwargs):
+        def execute(*args, **kwargs):
             for event in [lambda a, b: a**b, lambda a, b: a+b]:
-                print(event(**kwargs))
+                print(event(*args, **kwargs))
 
         execute(a=2, b=3)
         -> 8
         -> 5
 
-        This won't work.
+        This also works and is faster.
         execute(2, 3)
 
         Returns:
@@ -151,13 +181,59 @@ class Event:
 
         # We could speed this up by making it multi-threaded because no
         # events should rely on the output/outcome of another event.
-        for function in self:
-            function(**kwargs)
+        for function in self._function_tuple:
+            function(*args, **kwargs)
+
+    def _compile_fire(self):
+        """
+        Replace fire, for this instance only, with a generated function that has
+        this event's fixed signature and calls every function in turn with no loop,
+        e.g. for arguments=('timestep', 'time')
+            def fire(timestep, time):
+                function_0(timestep, time)
+                function_1(timestep, time)
+
+        This is used once the set of functions is locked in (see EventManager.lock).
+        Events without a fixed signature keep the generic fire, since forwarding
+        *args and **kwargs would cost about as much as the loop it saves.
+
+        Returns:
+            N/A
+        """
+
+        if self._arguments is None:
+            return
+
+        namespace = {f'function_{index}': function for index, function in enumerate(self._function_tuple)}
+        arguments = ', '.join(self._arguments)
+        lines = [f'def fire({arguments}):']
+        lines += [f'    {name}({arguments})' for name in namespace]
+        if len(namespace) == 0:
+            lines.append('    pass')
+
+        exec('\n'.join(lines), namespace)
+        self.fire = namespace['fire']
+        self._compiled = True
+
+    def _uncompile_fire(self):
+        """
+        Go back to the generic fire method.
+
+        Returns:
+            N/A
+        """
+
+        self.__dict__.pop('fire', None)
+        self._compiled = False
 
     @property
     def functions(self) -> list:
         return list(self._functions.keys())
 
+    @property
+    def arguments(self) -> [tuple, None]:
+        return self._arguments
+
 
 class EventManager:
     """
@@ -198,7 +274,7 @@ class EventManager:
     def __getitem__(self, key: str):
         # Allow access via class_name['property'] as well as class_name.property.
         # https://stackoverflow.com/questions/11469025/how-to-implement-a-subscriptable-class-in-python-subscriptable-class-not-subsc
-        if key in self.events:
+        if key in self._events:
             return self._events[key]
         else:
             raise AttributeError('{0} is not an event.'.format(key))
@@ -222,6 +298,8 @@ class EventManager:
         """
 
         self._events[name] = event
+        if self.lock is True:
+            event._compile_fire()
 
     def remove_event(self, name: str):
         """
@@ -231,11 +309,12 @@ class EventManager:
             name:       A descriptive name for the event.
 
         Returns:
-            N/A
+            N/A - except if the event's name is not in the _events dict then
+            this method will raise an AttributeError.
         """
 
         try:
-            _ = self._events.pop(name, None)
+            _ = self._events.pop(name)
         except KeyError:
             raise AttributeError('{0} is not an event.'.format(name))
 
@@ -249,4 +328,11 @@ class EventManager:
 
     @lock.setter
     def lock(self, value: bool):
+        # Once locked the set of events is fixed, so each event's fire is replaced
+        # with a generated straight-line version. Unlocking restores the generic fire.
         self.__lock = value
+        for event in self._events.values():
+            if value is True:
+                event._compile_fire()
+            else:
+                event._uncompile_fire()
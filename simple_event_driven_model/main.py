@@ -32,18 +32,19 @@ TODOs:
 """
 
 # Standard Library Imports
-
+import math
 
 # Custom Package Imports
 from sim_clock import SimClock
 from state import State, Cartesian
-from ballistic import Ballistic
+from ballistic import Ballistic, BallisticBatch
 
 
 def sim() -> tuple:
     # Define the clock
     clock = SimClock(timestep=0.01)
     max_time = 100.             # Maximum time the simulation will run to in seconds.
+    max_steps = math.ceil(max_time / clock.timestep) + 1    # Used to size each ball's state log.
 
     # Define the initial conditions. This would normally come from the
     # Excel file as would timestep and max_time above.
@@ -64,7 +65,8 @@ def sim() -> tuple:
                 y=0.,
                 z=-9.8          # Gravity at 9.8 m/s^2
             ),
-        )
+        ),
+        max_steps=max_steps
     )
 
     golf_ball_two = Ballistic(
@@ -84,18 +86,19 @@ def sim() -> tuple:
                 y=0.,
                 z=-9.8
             ),
-        )
+        ),
+        max_steps=max_steps
     )
 
-    # Define the model and it's connections.
-    clock.add_function_to_timestep(
-        name='golf_ball_one', function=golf_ball_one.dynamics
-    )
+    # Define the model and it's connections. Both golf balls are stepped together
+    # as a batch so there is only one function to fire each timestep.
+    golf_balls = BallisticBatch(ballistics=[golf_ball_one, golf_ball_two])
     clock.add_function_to_timestep(
-        name='golf_ball_two', function=golf_ball_two.dynamics
+        name='golf_balls', function=golf_balls.dynamics
     )
+    clock.lock = True
 
-    while clock.time <= max_time and (golf_ball_one.state.position.z >= 0 and golf_ball_two.state.position.z >= 0):
+    while clock.time <= max_time and golf_balls.all_above_ground():
         clock.execute_timestep()
 
     return golf_ball_one, golf_ball_two
@@ -12,6 +12,9 @@ Usage:
 
     clock = SimClock(timestep=0.01)
 
+    # Print the time to the screen every 100 timesteps.
+    clock = SimClock(timestep=0.01, verbose=True, log_every=100)
+
 Notes:
 
 
@@ -43,33 +46,54 @@ class SimClock:
     This class is a clock for a simulation.
     """
 
-    def __init__(self, timestep: [float, None] = None):
+    def __init__(self, timestep: [float, None] = None, verbose: bool = False, log_every: int = 100):
         """
 
         Args:
             timestep:       A float to define the timestep to be taken.
+            verbose:        If True, print the timestep and time to the screen
+                            while the sim runs.
+            log_every:      When verbose, only print every log_every timesteps.
+                            Printing every step is far slower than the physics.
         """
 
         # The timestep can be a float, constant value, or None. If None, then we
-        # are using an adaptive timestep.
-        if timestep is not None:
-            self._timestep = lambda: timestep
-        else:
-            # This isn't actually adaptive at this time. It is here to demonstrate
-            # how you would do it.
-            self._timestep = self.__adaptive_timestep
+        # are using an adaptive timestep. A constant timestep is stored directly so
+        # reading it doesn't require a function call every step.
+        #
+        # The adaptive timestep isn't actually adaptive at this time. It is here to
+        # demonstrate how you would do it.
+        self._constant_timestep = timestep
 
         self._time = 0.
+        self._step_count = 0
+        self._log_every = log_every
 
         # Events for the SimClock -
         #   timestep:   functions to fire at each timestep
-        self._events = EventManager(timestep=Event('timestep'))
+        self._events = EventManager(timestep=Event('timestep', arguments=('timestep', 'time')))
+
+        # Keep a direct reference to the timestep event since it fires every step.
+        self._timestep_event = self._events['timestep']
 
         # Add a basic event function to provide feedback, on screen, for the user.
-        self.add_function_to_timestep(
-            'user_feedback',
-            lambda timestep, time: print(f'Timestep: {timestep}, Time: {time} sec')
-        )
+        if verbose is True:
+            self.add_function_to_timestep('user_feedback', self.__user_feedback)
+
+    def __user_feedback(self, timestep: float, time: float):
+        """
+        Print the timestep and time to the screen every log_every timesteps.
+
+        Args:
+            timestep:   The timestep just taken. [sec]
+            time:       The absolute sim time. [sec]
+
+        Returns:
+            N/A
+        """
+
+        if self._step_count % self._log_every == 0:
+            print(f'Timestep: {timestep}, Time: {time} sec')
 
     def __adaptive_timestep(self) -> float:
         """
@@ -109,12 +133,27 @@ class SimClock:
 
         timestep = self.timestep
         self._time += timestep
+        self._step_count += 1
 
-        self._events['timestep'].fire(timestep=timestep, time=self._time)
+        # Functions on the timestep event are called as function(timestep, time).
+        self._timestep_event.fire(timestep, self._time)
+
+    @property
+    def lock(self) -> bool:
+        return self._events.lock
+
+    @lock.setter
+    def lock(self, value: bool):
+        # Locking the events once the model is connected lets each event fire its
+        # functions without a loop. See EventManager.lock.
+        self._events.lock = value
 
     @property
     def timestep(self) -> float:
-        return self._timestep()
+        if self._constant_timestep is not None:
+            return self._constant_timestep
+
+        return self.__adaptive_timestep()
 
     @property
     def time(self) -> float:
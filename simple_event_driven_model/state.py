@@ -5,7 +5,7 @@ Module:
 
 Description:
     This file holds a class for the State of an object as well as
-    a class, Cartesian, for the coordinate frame.
+    a simple [x, y, z] triplet, Cartesian, for the coordinate frame.
 
 Usage:
     from simple_event_driven_model.state import State, Cartesian
@@ -28,6 +28,17 @@ Usage:
         ),
     )
 
+    # Plain [x, y, z] arrays or lists can be used in place of Cartesian.
+    initial_state = State(
+        position=[0., 0., 15.],
+        velocity=[10., 10., 1.],
+        acceleration=[0., 0., -9.8],
+    )
+
+    # The triplets are live views into the state with Cartesian style access.
+    height = initial_state.position.z
+    initial_state.velocity.z = 0.
+
 Notes:
 
 
@@ -48,27 +59,21 @@ TODOs:
 """
 
 # Standard Library
+from typing import NamedTuple
+
 import numpy as np
 
 
-class Cartesian:
+class Cartesian(NamedTuple):
     """
-    A simple class for the Cartesian coordinate frame.
+    A simple [x, y, z] triplet for the Cartesian coordinate frame. This is only used to
+    make the initial conditions readable. State stores the values in a numpy array and
+    all of the math is done on that array.
     """
 
-    def __init__(self, x: float = 0., y: float = 0., z: float = 0.):
-        """
-        Instantiate the class.
-
-        Args:
-            x:      The x-axis value of the Cartesian coordinate vector.
-            y:      The y-axis value of the Cartesian coordinate vector.
-            z:      The z-axis value of the Cartesian coordinate vector.
-        """
-
-        self.x = x
-        self.y = y
-        self.z = z
+    x: float = 0.       # The x-axis value of the Cartesian coordinate vector.
+    y: float = 0.       # The y-axis value of the Cartesian coordinate vector.
+    z: float = 0.       # The z-axis value of the Cartesian coordinate vector.
 
     def __repr__(self):
         # This function defines the display when we type an instantiated class
@@ -80,84 +85,98 @@ class Cartesian:
         # instance into Spyder or iPython.
         return f'\tCartesian: [{self.x:0.4f}, {self.y:0.4f}, {self.z:0.4f}]'
 
-    def __add__(self, other) -> 'Cartesian':
-        # Add 2 Cartesian classes and return a new one.
-        if isinstance(other, Cartesian) is True:
-            output = Cartesian(
-                x=self.x + other.x,
-                y=self.y + other.y,
-                z=self.z + other.z
-            )
-        else:
-            raise ValueError('There is no method to multiply Cartesian by {0}.'.format(type(other)))
-
-        return output
-
-    def __sub__(self, other) -> 'Cartesian':
-        # Subtract 2 Cartesian classes and return a new one.
-
-        if isinstance(other, Cartesian) is True:
-            output = Cartesian(
-                x=self.x - other.x,
-                y=self.y - other.y,
-                z=self.z - other.z
-            )
-        else:
-            raise ValueError('There is no method to multiply Cartesian by {0}.'.format(type(other)))
-
-        return output
-
-    def __mul__(self, other) -> 'Cartesian':
-        # Multiply 2 Cartesian classes and return a new one. Or multiply a Cartesian vector by a
-        # float (scalar).
-
-        try:
-            _ = float(other)
-        except ValueError:
-            pass
-
-        if isinstance(other, float) is True:
-            output = Cartesian(
-                x=self.x * other,
-                y=self.y * other,
-                z=self.z * other
-            )
-
-            return output
-        elif isinstance(other, Cartesian) is True:
-            output_vector = np.cross(self.as_vector, other.as_vector)
-            return Cartesian.from_vector(output_vector)
-        else:
-            raise ValueError('There is no method to multiply Cartesian by {0}.'.format(type(other)))
-
-    @staticmethod
-    def from_vector(vector: np.array) -> 'Cartesian':
-        # Instantiate a Cartesian object from a vector.
-        return Cartesian(
-            x=vector[0],
-            y=vector[1],
-            z=vector[2]
-        )
+
+class CartesianView(np.ndarray):
+    """
+    An [x, y, z] row of a State's array. It is a numpy view, so the math works on it like
+    any other array and writing to it writes to the state, with the x, y, z, and as_vector
+    access of Cartesian for code written against the original Cartesian class.
+    """
+
+    @property
+    def x(self) -> float:
+        return self[0]
+
+    @x.setter
+    def x(self, value: float):
+        self[0] = value
+
+    @property
+    def y(self) -> float:
+        return self[1]
+
+    @y.setter
+    def y(self, value: float):
+        self[1] = value
+
+    @property
+    def z(self) -> float:
+        return self[2]
+
+    @z.setter
+    def z(self, value: float):
+        self[2] = value
 
     @property
     def as_vector(self) -> np.array:
-        return np.array([self.x, self.y, self.z])
+        # A plain array copy, like Cartesian.as_vector, which doesn't change the state.
+        return np.array(self)
+
+    def __repr__(self):
+        # This function defines the display when we type an instantiated class
+        # instance into Spyder or iPython.
+        return self.__str__()
+
+    def __str__(self):
+        # Displayed as a Cartesian. The results of math on views that aren't [x, y, z]
+        # triplets are displayed as arrays.
+        if self.shape != (3,):
+            return str(np.asarray(self))
+
+        return f'\tCartesian: [{self[0]:0.4f}, {self[1]:0.4f}, {self[2]:0.4f}]'
 
 
 class State:
     """
     A class for holding the state of an object. Currently the state is limited to the
-    time (float), position (Cartesian), velocity (Cartesian), and acceleration (Cartesian).
+    time (float), position, velocity, and acceleration.
+
+    The position, velocity, and acceleration are stored as the rows of a single (3, 3)
+    numpy array so the dynamics can update them in place rather than building new
+    objects every timestep.
     """
 
-    def __init__(self, position: Cartesian, velocity: Cartesian, acceleration: Cartesian):
+    # No per-instance __dict__, attribute access is a fixed slot lookup.
+    __slots__ = ('_data', 'time')
+
+    def __init__(
+            self,
+            position: [Cartesian, np.ndarray, list],
+            velocity: [Cartesian, np.ndarray, list],
+            acceleration: [Cartesian, np.ndarray, list],
+            dtype: type = np.float64
+    ):
         """
         Instantiate the class.
+
+        Args:
+            position:       The position of the object. Any [x, y, z] triplet works,
+                            a Cartesian, a numpy array, or a list. Arrays and lists
+                            are copied straight into the state without any wrapping.
+            velocity:       The velocity of the object, in the same forms as position.
+            acceleration:   The acceleration of the object, in the same forms as
+                            position.
+            dtype:          The numpy dtype the state is stored in. np.float32 halves
+                            the memory used by the state and its log, which helps with
+                            large numbers of objects, but it is only appropriate when
+                            the loss of precision is acceptable.
         """
 
-        self._position = position
-        self._velocity = velocity
-        self._acceleration = acceleration
+        # Rows: 0 = position, 1 = velocity, 2 = acceleration. Columns: x, y, z.
+        self._data = np.array((position, velocity, acceleration), dtype=dtype)
+        if self._data.shape != (3, 3):
+            raise ValueError(f'position, velocity, and acceleration must each have 3 values, not {self._data.shape}.')
+
         self.time = 0.
 
     def __repr__(self):
@@ -168,35 +187,52 @@ class State:
     def __str__(self):
         # This function defines the display when we type an instantiated class
         # instance into Spyder or iPython.
-        return f'\tState: \n\t\t\tPosition: {self._position}\n\t\t\tVelocity: {self._velocity}\n\t\tAcceleration: {self._acceleration}'
+        return f'\tState: \n\t\t\tPosition: {self.position}\n\t\t\tVelocity: {self.velocity}\n\t\tAcceleration: {self.acceleration}'
 
     @property
-    def position(self) -> Cartesian:
-        return self._position
+    def position(self) -> CartesianView:
+        # This is a view into the state array. Changing it, including via .x/.y/.z,
+        # changes the state.
+        return self._data[0].view(CartesianView)
 
     @position.setter
-    def position(self, value: Cartesian):
+    def position(self, value: [Cartesian, np.ndarray, list]):
         # We do it this way only so that we can add checks on value later.
-        self._position = value
+        self._data[0] = value
 
     @property
-    def velocity(self) -> Cartesian:
-        return self._velocity
+    def velocity(self) -> CartesianView:
+        # This is a view into the state array. Changing it, including via .x/.y/.z,
+        # changes the state.
+        return self._data[1].view(CartesianView)
 
     @velocity.setter
-    def velocity(self, value: Cartesian):
+    def velocity(self, value: [Cartesian, np.ndarray, list]):
         # We do it this way only so that we can add checks on value later.
-        self._velocity = value
+        self._data[1] = value
 
     @property
-    def acceleration(self) -> Cartesian:
-        return self._acceleration
+    def acceleration(self) -> CartesianView:
+        # This is a view into the state array. Changing it, including via .x/.y/.z,
+        # changes the state.
+        return self._data[2].view(CartesianView)
 
     @acceleration.setter
-    def acceleration(self, value: Cartesian):
+    def acceleration(self, value: [Cartesian, np.ndarray, list]):
         # We do it this way only so that we can add checks on value later.
-        self._acceleration = value
+        self._data[2] = value
+
+    @property
+    def as_cartesian(self) -> tuple:
+        # Cartesian copies of position, velocity, and acceleration for code that still
+        # expects Cartesian objects.
+        return tuple(Cartesian(*row.tolist()) for row in self._data)
 
     @property
     def as_vector(self) -> np.array:
-        return np.hstack((self.time, self.position.as_vector, self.velocity.as_vector, self.acceleration.as_vector))
+        # Time followed by position, velocity, and acceleration. This is built with a
+        # single allocation rather than stacking intermediate arrays.
+        vector = np.empty(10, dtype=self._data.dtype)
+        vector[0] = self.time
+        vector[1:] = self._data.ravel()
+        return vector
@@ -3,14 +3,16 @@ Module:
     coordinates.py
 
 Description:
-    <Short description, but thorough, of what is included in the file.>
+    This file provides classes for coordinate systems.
 
 Usage:
-    <from some_module import some_function>
-    <Provide a simple example for each class and function in the file.>
+    from env.coordinates import CartesianPoint, CartesianVector, Attitude
+    point = CartesianPoint(0, 2, 5)
 
 Notes:
-
+    The coordinates are single precision by default. For accuracy checks run with the
+    environment variable TOWER_DEFENSE_COORD_DTYPE=float64, or call
+    set_coord_dtype(np.float64) before any points or Worlds are created.
 
 References:
 
@@ -34,6 +36,517 @@ TODOs:
 """
 
 # Standard library imports
+import os
 
+import numpy as np
 
 # Tool imports
+import utils
+from utils.pool import CartesianPointPool
+
+
+# The number of points POINT_POOL can hold.
+POINT_POOL_CAPACITY = 4096
+
+
+def _check_coord_dtype(dtype) -> type:
+    """
+    Check a coordinate dtype is a floating point type.
+
+    Args:
+        dtype:      The dtype, e.g. np.float64 or 'float64'.
+
+    Returns:
+        (type)      The numpy scalar type of the dtype, e.g. np.float64.
+    """
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f'The coordinate dtype must be a floating point type, got {dtype}.')
+
+    return dtype.type
+
+
+# The dtype of the coordinates. Single precision is plenty for the sim's physics and
+# halves the memory the point buffers take. Use float64 when checking numerical
+# accuracy, see set_coord_dtype and the Notes at the top of the file.
+COORD_DTYPE = _check_coord_dtype(os.environ.get('TOWER_DEFENSE_COORD_DTYPE', 'float32'))
+
+# Points take their storage from this pool unless they are given another one. This
+# avoids allocating a new numpy array for every point, including the results of
+# arithmetic on points.
+POINT_POOL = CartesianPointPool(capacity=POINT_POOL_CAPACITY, dtype=COORD_DTYPE)
+
+# The __repr__ format strings, built once per class and mapping.
+_REPR_TEMPLATES = {}
+
+
+def set_coord_dtype(dtype):
+    """
+    Change the dtype of the coordinates, e.g. to np.float64 for accuracy checks. POINT_POOL
+    is rebuilt with the new dtype. The frames' cached DCMs are keyed on the dtype so they
+    are rebuilt on their next use. Points created before the change keep the old dtype, so
+    call this before creating any points or Worlds.
+
+    Args:
+        dtype:      The floating point dtype, e.g. np.float64 or 'float64'.
+
+    Returns:
+        N/A - module variables are updated.
+    """
+
+    global COORD_DTYPE, POINT_POOL
+
+    COORD_DTYPE = _check_coord_dtype(dtype)
+    POINT_POOL = CartesianPointPool(capacity=POINT_POOL_CAPACITY, dtype=COORD_DTYPE)
+
+
+class CartesianPoint:
+    """
+    This class holds a point in a Cartesian coordinate system.
+    """
+
+    DEFAULT_MAP = {'x': 0, 'y': 1, 'z': 2}
+
+    # There can be 10k+ points in a sim so they don't get a per-instance __dict__.
+    __slots__ = ('_vector', '_mapping', '_repr_cache', '_fast', '_pool', '_slot')
+
+    def __init__(
+            self,
+            x: float,
+            y: float,
+            z: float,
+            mapping: [dict, None] = None,
+            pool: [CartesianPointPool, None] = None
+    ):
+        """
+        Instantiate the class.
+
+        Args:
+            x:          The value along the x-axis of the Cartesian coordinates.
+            y:          The value along the y-axis of the Cartesian coordinates.
+            z:          The value along the z-axis of the Cartesian coordinates.
+            mapping:    Mapping of coordinates to elements in the vector.
+            pool:       The pool the vector's memory comes from. Defaults to POINT_POOL.
+
+        Notes:
+            Units (meters vs feet) need to be scrubbed at a level above this.
+        """
+
+        if mapping is None:
+            mapping = self.DEFAULT_MAP
+
+        self._mapping = mapping
+
+        # Nearly every point uses the default mapping. For those the accessors index
+        # the vector directly rather than looking the index up in the mapping.
+        self._fast = mapping is CartesianPoint.DEFAULT_MAP
+
+        # (vector bytes, repr string) of the last __repr__.
+        self._repr_cache = None
+
+        self._acquire_vector(pool=pool)
+        self._set_values_based_on_mapping(x=x, y=y, z=z)
+
+    def __del__(self):
+        # Return the vector's memory to the pool. The point owns its slot and as_vector
+        # hands out copies, so nothing else is using the memory.
+        if self._pool is not None:
+            self._pool.release(self._slot)
+            self._pool = None
+
+    def __reduce__(self):
+        # Pickle only the point's values and mapping. The pool is shared by every point so
+        # it isn't pickled with one, the unpickled point takes a slot from POINT_POOL.
+        mapping = None if self._mapping is CartesianPoint.DEFAULT_MAP else self._mapping
+        return self.__class__, (float(self.x), float(self.y), float(self.z), mapping)
+
+    def __copy__(self) -> 'CartesianPoint':
+        # A copy needs a slot of its own, copying the slots would have two points own one.
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> 'CartesianPoint':
+        # Copy the values into a new slot of the same pool rather than copying the pool.
+        return self.copy()
+
+    def _acquire_vector(self, pool: [CartesianPointPool, None]):
+        """
+        Take the memory for the vector from a pool. If the pool is full the point
+        falls back to allocating its own vector.
+
+        Args:
+            pool:       The pool the vector's memory comes from. Defaults to POINT_POOL.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        if pool is None:
+            pool = POINT_POOL
+
+        self._slot = pool.acquire()
+        if self._slot is not None:
+            self._pool = pool
+            self._vector = pool.view(self._slot)
+        else:
+            self._pool = None
+            self._vector = np.zeros(3, dtype=pool.buffer.dtype)
+
+    @classmethod
+    def _empty(cls, mapping: dict, pool: [CartesianPointPool, None] = None) -> 'CartesianPoint':
+        # A point whose vector will be written to directly, e.g. as the out of a numpy
+        # operation. The vector's values are not initialized.
+        point = cls.__new__(cls)
+        point._mapping = mapping
+        point._fast = mapping is CartesianPoint.DEFAULT_MAP
+        point._repr_cache = None
+        point._acquire_vector(pool=pool)
+
+        return point
+
+    def _set_values_based_on_mapping(self, x: float, y: float, z: float):
+        """
+        The default mapping may not be the desired mapping for a user. They can
+        override that mapping. This is a convenience function for setting the values
+        in the vector. The point is stored and operated on as a vector because it
+        is much faster than working with individual points and most calculations
+        are done on the vector anyway.
+
+        Args:
+            x:          The value along the x-axis of the Cartesian coordinates.
+            y:          The value along the y-axis of the Cartesian coordinates.
+            z:          The value along the z-axis of the Cartesian coordinates.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        if self._fast:
+            self._vector[0] = x
+            self._vector[1] = y
+            self._vector[2] = z
+            return
+
+        self._vector[self._mapping['x']] = x
+        self._vector[self._mapping['y']] = y
+        self._vector[self._mapping['z']] = z
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        for k, _ in self._mapping.items():
+            output += utils.strings.formatted_line(f'{k}: {self[k]}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        # The vector can be written to directly (e.g. the out of a numpy operation or
+        # via the pool's buffer) so the cached repr is keyed on the vector's bytes rather than
+        # being cleared by the setters.
+        key = self._vector.tobytes()
+        if self._repr_cache is not None and self._repr_cache[0] == key:
+            return self._repr_cache[1]
+
+        output = self._repr_template().format(*(self._vector[index] for index in self._mapping.values()))
+        # output += f'\n\n{self}'
+
+        self._repr_cache = (key, output)
+        return output
+
+    def _repr_template(self) -> str:
+        # Build the __repr__ format string, with a {} for the value of each axis, once
+        # per class and mapping.
+        template_key = (self.__class__, tuple(self._mapping.items()))
+        template = _REPR_TEMPLATES.get(template_key)
+        if template is None:
+            template = utils.strings.formatted_line(f'{self.__class__.__name__}', tab_level=1)
+            for k in self._mapping:
+                template += utils.strings.formatted_line(f'{k}={{}},', tab_level=2)
+
+            mapping_line = utils.strings.formatted_line(f'mapping={self._mapping},', tab_level=2)
+            template += mapping_line.replace('{', '{{').replace('}', '}}')
+
+            template += utils.strings.formatted_line(')', tab_level=1)
+            _REPR_TEMPLATES[template_key] = template
+
+        return template
+
+    def __getitem__(self, key: str):
+        # Allow access via class_name['property'].
+        # https://stackoverflow.com/questions/11469025/how-to-implement-a-subscriptable-class-in-python-subscriptable-class-not-subsc
+        return self._vector[self._mapping[key]]
+
+    def __setitem__(self, key: str, value):
+        # Allows for setting an instance property via class_name['property'] = value
+        self._vector[self._mapping[key]] = value
+
+    def _check_mapping(self, other: 'CartesianPoint'):
+        # The vectors are added element by element, so both must use the same mapping.
+        # Nearly every point shares the default mapping, so check identity first.
+        if other._mapping is not self._mapping and other._mapping != self._mapping:
+            raise ValueError(
+                f'Cannot combine points with different mappings, {self._mapping} and {other._mapping}.'
+            )
+
+    def __add__(self, other) -> 'CartesianPoint':
+        # The result has the type of self so arithmetic on a CartesianVector, e.g.
+        # velocity * dt, stays a vector and is only rotated, not translated, by the frame
+        # transforms.
+        self._check_mapping(other)
+        output = self._empty(mapping=self.mapping, pool=self._pool)
+        np.add(self._vector, other._vector, out=output._vector)
+        return output
+
+    def __sub__(self, other) -> 'CartesianPoint':
+        # Keeps the type of self, see __add__.
+        self._check_mapping(other)
+        output = self._empty(mapping=self.mapping, pool=self._pool)
+        np.subtract(self._vector, other._vector, out=output._vector)
+        return output
+
+    def __mul__(self, other) -> 'CartesianPoint':
+        # Just use numpy's multiplication. Keeps the type of self, see __add__.
+        output = self._empty(mapping=self.mapping, pool=self._pool)
+        try:
+            np.multiply(self._vector, other._vector, out=output._vector)
+        except AttributeError:
+            np.multiply(self._vector, other, out=output._vector)
+
+        return output
+
+    def __rmul__(self, other) -> 'CartesianPoint':
+        # Just use numpy's multiplication.
+        return self.__mul__(other)
+
+    def iadd(self, other: 'CartesianPoint') -> 'CartesianPoint':
+        """
+        Add other to this point in place, i.e. without creating a new point. This is
+        meant for updates done every timestep, e.g. position.iadd(velocity * timestep).
+
+        Args:
+            other:      The point or vector to add. It must use the same mapping, else a
+                        ValueError is raised.
+
+        Returns:
+            (CartesianPoint) This point, so calls can be chained.
+        """
+
+        self._check_mapping(other)
+        np.add(self._vector, other._vector, out=self._vector)
+        return self
+
+    def isub(self, other: 'CartesianPoint') -> 'CartesianPoint':
+        """
+        Subtract other from this point in place, i.e. without creating a new point.
+
+        Args:
+            other:      The point or vector to subtract. It must use the same mapping,
+                        else a ValueError is raised.
+
+        Returns:
+            (CartesianPoint) This point, so calls can be chained.
+        """
+
+        self._check_mapping(other)
+        np.subtract(self._vector, other._vector, out=self._vector)
+        return self
+
+    def imul(self, other) -> 'CartesianPoint':
+        """
+        Multiply this point in place, i.e. without creating a new point.
+
+        Args:
+            other:      A scalar or a point/vector with the same mapping, which is
+                        multiplied element by element.
+
+        Returns:
+            (CartesianPoint) This point, so calls can be chained.
+        """
+
+        try:
+            np.multiply(self._vector, other._vector, out=self._vector)
+        except AttributeError:
+            np.multiply(self._vector, other, out=self._vector)
+
+        return self
+
+    def copy(self) -> 'CartesianPoint':
+        """
+        Returns a copy of this instance of the object.
+
+        Returns:
+            (CartesianPoint) Copy of this instance.
+        """
+
+        return self.__class__(
+            x=self.x,
+            y=self.y,
+            z=self.z,
+            mapping=self._mapping,
+            pool=self._pool
+        )
+
+    @classmethod
+    def from_vector(cls, vector: np.array, mapping: [dict, None] = None) -> 'CartesianPoint':
+        """
+        This method allows for the creation of a CartesianPoint from a vector. Called
+        on a CartesianVector it creates a CartesianVector.
+
+        Args:
+            vector:     Vector of values for each axis.
+            mapping:    Mapping of coordinates to elements in the vector.
+
+        Returns:
+
+        """
+
+        if mapping is None:
+            mapping = CartesianPoint.DEFAULT_MAP
+
+        # Instantiate a Cartesian object from a vector. The vector is already ordered
+        # per the mapping so it is copied straight into the point's memory.
+        output = cls._empty(mapping=mapping)
+        np.copyto(output._vector, np.reshape(vector, output._vector.shape))
+        return output
+
+    def convert_point_to_new_map(self, mapping: dict) -> 'CartesianPoint':
+        """
+        While it is unlikely that we would want to use different maps for Cartesian points
+        it is conceivable. As a result, this conversion method is provided.
+
+        Args:
+            mapping:        Mapping of coordinates to elements in the vector.
+
+        Returns:
+            (CartesianPoint) Point with the vector conforming to the new mapping.
+        """
+
+        return self.__class__(
+            x=self.x,
+            y=self.y,
+            z=self.z,
+            mapping=mapping
+        )
+
+    @property
+    def as_vector(self) -> np.array:
+        # A copy of the vector. The point's own memory is a slot of its pool, which is
+        # reused as soon as the point is deleted, e.g. for a temporary like (a + b), so
+        # handing it out would let the next point silently overwrite the caller's array.
+        # Use the setter, x/y/z, or the in-place methods to change the point.
+        return self._vector.copy()
+
+    @as_vector.setter
+    def as_vector(self, value: np.ndarray):
+        # Copy into the existing memory so the point keeps its slot in the pool.
+        np.copyto(self._vector, np.reshape(value, self._vector.shape))
+
+    @property
+    def x(self) -> float:
+        if self._fast:
+            return self._vector[0]
+        return self._vector[self._mapping['x']]
+
+    @x.setter
+    def x(self, value: float):
+        if self._fast:
+            self._vector[0] = value
+            return
+        self._vector[self._mapping['x']] = value
+
+    @property
+    def y(self) -> float:
+        if self._fast:
+            return self._vector[1]
+        return self._vector[self._mapping['y']]
+
+    @y.setter
+    def y(self, value: float):
+        if self._fast:
+            self._vector[1] = value
+            return
+        self._vector[self._mapping['y']] = value
+
+    @property
+    def z(self) -> float:
+        if self._fast:
+            return self._vector[2]
+        return self._vector[self._mapping['z']]
+
+    @z.setter
+    def z(self, value: float):
+        if self._fast:
+            self._vector[2] = value
+            return
+        self._vector[self._mapping['z']] = value
+
+    @property
+    def mapping(self) -> dict:
+        return self._mapping
+
+    @property
+    def pool(self) -> [CartesianPointPool, None]:
+        # The pool holding this point's vector or None if it has its own vector.
+        return self._pool
+
+    @property
+    def slot(self) -> [int, None]:
+        # The row of pool.buffer holding this point or None if it isn't in a pool. The
+        # buffer also holds vectors and free rows, so batches of points are gathered by
+        # their slots rather than operated on as the whole buffer.
+        return self._slot
+
+
+class CartesianVector(CartesianPoint):
+    """
+    This class holds a vector in a Cartesian coordinate system.
+
+    A vector, e.g. a velocity or a force, has a direction and magnitude but no
+    location. So when it is transformed to another frame it is only rotated, while a
+    point is also translated by the offset between the frames' origins.
+    """
+
+    __slots__ = ()
+
+
+
+class Attitude:
+    """
+    This class holds the attitude of a reference frame wrt its base frame as the 3 Euler
+    angles of a Yaw-Pitch-Roll rotation, see utils.angles.dcm.
+    """
+
+    __slots__ = ('w_x', 'w_y', 'w_z')
+
+    def __init__(self, w_x: float = 0., w_y: float = 0., w_z: float = 0.):
+        """
+        Instantiate the class.
+
+        Args:
+            w_x:        Rotation about the x-axis (roll). [rad]
+            w_y:        Rotation about the y-axis (pitch). [rad]
+            w_z:        Rotation about the z-axis (yaw). [rad]
+
+        Notes:
+            The angles can be changed in place. The frames check them before using their
+            cached DCMs.
+        """
+
+        self.w_x = w_x
+        self.w_y = w_y
+        self.w_z = w_z
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        for k in self.__slots__:
+            output += utils.strings.formatted_line(f'{k}: {getattr(self, k)}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}', tab_level=1)
+        for k in self.__slots__:
+            output += utils.strings.formatted_line(f'{k}={getattr(self, k)},', tab_level=2)
+
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
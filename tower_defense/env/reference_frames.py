@@ -6,7 +6,7 @@ Description:
     <Short description, but thorough, of what is included in the file.>
 
 Usage:
-    <from some_module import some_function>
+    from env.reference_frames import CartesianInertial, CartesianTranslatingFrame, CartesianStaticOffsetFrame
     <Provide a simple example for each class and function in the file.>
 
 Notes:
@@ -21,6 +21,7 @@ License:
     See LICENSE.txt
 
 """
+import numpy as np
 
 """
 Version History:
@@ -35,5 +36,458 @@ TODOs:
 
 # Standard library imports
 
+# Numba is optional. If it isn't installed the batch transforms use numpy.
+try:
+    import numba
+except ImportError:
+    numba = None
 
 # Tool imports
+from env import coordinates
+import utils
+
+
+# The DCM of every NED frame, a 180 deg roll, for each coordinate dtype. It's a constant
+# so it is shared by every NedToInertialFrame rather than each one computing it.
+_NED_DCMS = {}
+
+
+def _ned_dcm(dtype: type) -> np.ndarray:
+    # The read-only NED DCM in the coordinate dtype, built once per dtype.
+    dcm = _NED_DCMS.get(dtype)
+    if dcm is None:
+        dcm = np.array(
+            [[1., 0., 0.],
+             [0., -1., 0.],
+             [0., 0., -1.]],
+            dtype=dtype
+        )
+        dcm.flags.writeable = False
+        _NED_DCMS[dtype] = dcm
+
+    return dcm
+
+
+# The batch transform kernel, out = dcm @ point + bias for every row of points. Both
+# directions of a rotating frame's transform have this form (see affine_bias). Each row
+# of points is read into locals before its row of out is written, so out can be points
+# to transform in place.
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _batch_affine(points: np.ndarray, dcm: np.ndarray, bias: np.ndarray, out: np.ndarray):
+        # Rotation and translation in one pass over the points, done in parallel.
+        for i in numba.prange(points.shape[0]):
+            p_0 = points[i, 0]
+            p_1 = points[i, 1]
+            p_2 = points[i, 2]
+            for j in range(3):
+                out[i, j] = dcm[j, 0] * p_0 + dcm[j, 1] * p_1 + dcm[j, 2] * p_2 + bias[j]
+
+else:
+    def _batch_affine(points: np.ndarray, dcm: np.ndarray, bias: np.ndarray, out: np.ndarray):
+        # The matmul writes straight into out so no intermediate array is allocated.
+        np.matmul(points, dcm.T, out=out)
+        out += bias
+
+
+class CartesianInertial:
+    """
+    This class defines an Inertial Reference Frame with a Cartesian coordinate system.
+    """
+
+    def __init__(self, mapping: [dict, None] = None):
+        """
+        Instantiate the class.
+
+        Args:
+            mapping:    Mapping of coordinates to elements in the coordinate system vector.
+        """
+
+        # Note the inertial frame has +x pointed along North, +y along West, and +z Up.
+        # It is presume that the origin of the entire sim is the origin of the Inertial
+        # frame and we put it at (0, 0, 0) for convenience. Within a local theater it is
+        # assumed that the origin is also on the surface of the Earth/Map. In other words,
+        # this isn't an ECI style reference frame but rather and ECEF frame.
+        self._origin = coordinates.CartesianPoint(x=0., y=0., z=0., mapping=mapping)
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        output += utils.strings.formatted_line(f'Origin: {self.origin}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}', tab_level=1)
+        output += utils.strings.formatted_line(f'mapping={self.origin.mapping}', tab_level=2)
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
+
+    @property
+    def origin(self) -> coordinates.CartesianPoint:
+        return self._origin
+
+
+class CartesianStaticOffsetFrame:
+    """
+    This class defines a reference frame which is translated but not rotated wrt an
+    instance of CartesianInertial.
+    """
+
+    def __init__(
+            self,
+            base_frame: [CartesianInertial, 'CartesianStaticOffsetFrame'],
+            origin: coordinates.CartesianPoint
+    ):
+        """
+        Instantiate the class.
+
+        Args:
+            base_frame:         The Base Frame object this frame references.
+            origin:             This is the origin of the Static Frame in Inertial Frame
+                                coordinates.
+        """
+
+        self._origin = origin
+        self._base_frame = base_frame
+        self._objects = {}
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        output += utils.strings.formatted_line(f'Base Frame: {self.base_frame}', tab_level=1)
+        output += utils.strings.formatted_line(f'Origin: {self.origin}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}', tab_level=1)
+        output += utils.strings.formatted_line(f'base_frame={self.base_frame}', tab_level=2)
+        output += utils.strings.formatted_line(f'origin={self.origin}', tab_level=2)
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
+
+    def add_object_to_reference_frame(self, name: str, obj):
+        """
+        Add an object to this Reference Frame.
+
+        Args:
+            name:   Human-readable name of the object.
+            obj:    Instantiated object in the "world".
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._objects[name] = obj
+
+    @property
+    def origin(self) -> coordinates.CartesianPoint:
+        return self._origin
+
+    @property
+    def base_frame(self) -> CartesianInertial:
+        return self._base_frame
+
+
+class CartesianTranslatingFrame(CartesianStaticOffsetFrame):
+    """
+    This class defines a reference frame which translates but does not rotate. The translation
+    is wrt an instance of CartesianInertial.
+    """
+
+    def __init__(
+            self,
+            base_frame: [CartesianInertial, CartesianStaticOffsetFrame],
+            origin: coordinates.CartesianPoint
+    ):
+        """
+        Instantiate the class.
+
+        Args:
+            base_frame:         The Inertial Frame object for the simulation.
+            origin:             This is the origin of the Static Frame in Inertial Frame
+                                coordinates.
+        """
+
+        super().__init__(base_frame=base_frame, origin=origin)
+
+    @property
+    def origin(self) -> coordinates.CartesianPoint:
+        return self._origin
+
+    @origin.setter
+    def origin(self, value: coordinates.CartesianPoint):
+        self._origin = value
+
+
+class CartesianTranslatingRotatingFrame(CartesianTranslatingFrame):
+    """
+    This class holds a reference frame which can translate and rotate wrt the
+    Inertial Frame.
+    """
+
+    def __init__(
+            self,
+            base_frame: [CartesianInertial, CartesianStaticOffsetFrame],
+            origin: coordinates.CartesianPoint,
+            attitude: coordinates.Attitude
+    ):
+        """
+        Instantiate the class.
+
+        Args:
+            base_frame:         The Base Frame object that this frame references.
+            origin:             This is the origin of the Static Frame in the Base Frame
+                                coordinates.
+            attitude:           Attitude of the reference frame wrt to the Base Frame.
+        """
+
+        super().__init__(base_frame=base_frame, origin=origin)
+        self._attitude = attitude
+
+        # The DCMs are cached and only rebuilt when the attitude angles or the coordinate
+        # dtype change. The key is the (w_x, w_y, w_z, dtype) the cache was built from.
+        self._dcm_cache = None
+        self._dcm_frame_to_base_cache = None
+        self._dcm_key = None
+
+        # -dcm_base_to_frame @ origin, see affine_bias. The key is the DCM key and the
+        # origin's bytes since the origin can move without the setter being used.
+        self._affine_bias_cache = None
+        self._affine_bias_key = None
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        output += utils.strings.formatted_line(f'Base Frame: {self.base_frame}', tab_level=1)
+        output += utils.strings.formatted_line(f'Origin: {self.origin}', tab_level=1)
+        output += utils.strings.formatted_line(f'Attitude: {self.attitude}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}', tab_level=1)
+        output += utils.strings.formatted_line(f'base_frame={self.base_frame}', tab_level=2)
+        output += utils.strings.formatted_line(f'origin={self.origin}', tab_level=2)
+        output += utils.strings.formatted_line(f'attitude={self.attitude}', tab_level=2)
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
+
+    def transform_point_in_base_frame_to_this_frame(
+            self,
+            point: [coordinates.CartesianPoint, coordinates.CartesianVector],
+            out: [coordinates.CartesianPoint, coordinates.CartesianVector, None] = None
+    ) -> [coordinates.CartesianPoint, coordinates.CartesianVector]:
+        """
+        Transform a point or vector in the Base Frame to this frame. A point is rotated
+        and translated. A vector, e.g. a velocity, is only rotated.
+
+        Args:
+            point:      The point or vector in the Base Frame.
+            out:        The point or vector the result is written to, so nothing is
+                        allocated. It can be point itself. A new one is created if this
+                        isn't provided.
+
+        Returns:
+            (CartesianPoint, CartesianVector) The point or vector in this frame, out if
+            it was provided.
+        """
+
+        if out is None:
+            out = point._empty(mapping=point.mapping, pool=point.pool)
+
+        np.matmul(self.dcm_base_to_frame, point._vector, out=out._vector)
+        if not isinstance(point, coordinates.CartesianVector):
+            np.add(out._vector, self.affine_bias, out=out._vector)
+
+        return out
+
+    def transform_point_in_this_frame_to_base_frame(
+            self,
+            point: [coordinates.CartesianPoint, coordinates.CartesianVector],
+            out: [coordinates.CartesianPoint, coordinates.CartesianVector, None] = None
+    ) -> [coordinates.CartesianPoint, coordinates.CartesianVector]:
+        """
+        Transform a point or vector in this frame to the Base Frame. A point is rotated
+        and translated. A vector, e.g. a velocity, is only rotated.
+
+        Args:
+            point:      The point or vector in this frame.
+            out:        The point or vector the result is written to, so nothing is
+                        allocated. It can be point itself. A new one is created if this
+                        isn't provided.
+
+        Returns:
+            (CartesianPoint, CartesianVector) The point or vector in the Base Frame, out
+            if it was provided.
+        """
+
+        if out is None:
+            out = point._empty(mapping=point.mapping, pool=point.pool)
+
+        np.matmul(self.dcm_frame_to_base, point._vector, out=out._vector)
+        if not isinstance(point, coordinates.CartesianVector):
+            np.add(out._vector, self.origin._vector, out=out._vector)
+
+        return out
+
+    def transform_points_in_base_frame_to_this_frame(
+            self,
+            points: np.ndarray,
+            out: [np.ndarray, None] = None
+    ) -> np.ndarray:
+        """
+        The batch version of transform_point_in_base_frame_to_this_frame. All of the
+        points are transformed in one call, in parallel when Numba is installed,
+        rather than one call per point.
+
+        Args:
+            points:     (N, 3) array of points in the Base Frame, one point per row. For
+                        example the buffer of a CartesianPointPool.
+            out:        (N, 3) array the results are written to. A new array is
+                        allocated if this isn't provided. It can be points itself.
+
+        Returns:
+            (np.ndarray) (N, 3) array of the points in this frame.
+        """
+
+        dcm = self.dcm_base_to_frame
+        if out is None:
+            out = np.empty(points.shape, dtype=np.result_type(points.dtype, dcm.dtype))
+
+        _batch_affine(points, dcm, self.affine_bias, out)
+        return out
+
+    def transform_points_in_this_frame_to_base_frame(
+            self,
+            points: np.ndarray,
+            out: [np.ndarray, None] = None
+    ) -> np.ndarray:
+        """
+        The batch version of transform_point_in_this_frame_to_base_frame.
+
+        Args:
+            points:     (N, 3) array of points in this frame, one point per row.
+            out:        (N, 3) array the results are written to. A new array is
+                        allocated if this isn't provided. It can be points itself.
+
+        Returns:
+            (np.ndarray) (N, 3) array of the points in the Base Frame.
+        """
+
+        dcm = self.dcm_frame_to_base
+        if out is None:
+            out = np.empty(points.shape, dtype=np.result_type(points.dtype, dcm.dtype))
+
+        _batch_affine(points, dcm, self.origin._vector, out)
+        return out
+
+    @property
+    def attitude(self) -> coordinates.Attitude:
+        return self._attitude
+
+    @attitude.setter
+    def attitude(self, value: coordinates.Attitude):
+        self._attitude = value
+        self._dcm_key = None
+
+    def _update_dcm_cache(self):
+        # Rebuild the cached DCMs if the attitude angles, or the coordinate dtype (see
+        # coordinates.set_coord_dtype), have changed since they were built. The key is
+        # checked, rather than relying on the setter alone, because the attitude object
+        # can be modified in place.
+        attitude = self._attitude
+        key = (attitude.w_x, attitude.w_y, attitude.w_z, coordinates.COORD_DTYPE)
+        if key == self._dcm_key:
+            return
+
+        dcm = utils.angles.dcm(w_x=key[0], w_y=key[1], w_z=key[2], dtype=key[3])
+
+        # The cached arrays are shared by every caller so they are made read-only.
+        dcm.flags.writeable = False
+        self._dcm_cache = dcm
+        self._dcm_frame_to_base_cache = dcm.T
+        self._dcm_key = key
+
+    @property
+    def dcm_base_to_frame(self) -> np.ndarray:
+        # This calculates the DCM from some base to this frame. The base
+        # can be the inertial frame or a NED frame or something else. This
+        # is relative to that base.
+        self._update_dcm_cache()
+        return self._dcm_cache
+
+    @property
+    def dcm_frame_to_base(self) -> np.ndarray:
+        # This calculates the DCM from this frame to some base. The base
+        # can be the inertial frame or a NED frame or something else. This
+        # is relative to that base.
+        self._update_dcm_cache()
+        return self._dcm_frame_to_base_cache
+
+    @property
+    def affine_bias(self) -> np.ndarray:
+        # The translation of the base to frame transform once the rotation is folded in,
+        # dcm @ (point - origin) = dcm @ point + affine_bias. With it the transform is one
+        # multiply-add per point rather than a subtract and then a multiply.
+        self._update_dcm_cache()
+        origin = self.origin._vector
+        key = (self._dcm_key, origin.tobytes())
+        if key != self._affine_bias_key:
+            bias = -(self._dcm_cache @ origin)
+            bias.flags.writeable = False
+            self._affine_bias_cache = bias
+            self._affine_bias_key = key
+
+        return self._affine_bias_cache
+
+
+class NedToInertialFrame(CartesianTranslatingRotatingFrame):
+    """
+    The NED frame used in aircraft stands for North-East-Down where +x points
+    along North, +y points along East, and +z points down toward the center of
+    the Earth.
+
+    Note that the Body Frame for an aircraft would have +x along the velocity
+    vector.
+
+    Additional note, this is an example of how one could build a specialized
+    frame within this framework. Since we do not need to model aircraft dynamics
+    we don't need this frame within the tower defense framework.
+    """
+
+    def __init__(
+            self,
+            base_frame: [CartesianInertial, CartesianStaticOffsetFrame],
+            origin: coordinates.CartesianPoint,
+    ):
+        """
+        Instantiate the class.
+
+        Args:
+            base_frame:         The Base Frame object that this frame references.
+            origin:             This is the origin of the Static Frame in the Base Frame
+                                coordinates.
+        """
+
+        # The DCM used in this sim is the same as is usually used for aircraft.
+        # That is to say it is Rot_z * Rot_y * Rot_x or Yaw-Pitch-Roll. The order
+        # matters and for a different order these w_x, w_y, and w_z values would
+        # produce a different frame.
+        #
+        # Note that in a tracking type Cartesian reference frame we have +x along
+        # North, +z Up, and that requires +y be West.
+        ned_attitude = coordinates.Attitude(
+            w_x=np.pi,
+            w_y=0.,
+            w_z=0.
+        )
+        super().__init__(base_frame=base_frame, origin=origin, attitude=ned_attitude)
+
+        # Seed the DCM cache with the constant NED DCM. The key matches the attitude so
+        # it is used unless the attitude is changed. The DCM is symmetric so it is also
+        # its own transpose.
+        self._dcm_cache = _ned_dcm(coordinates.COORD_DTYPE)
+        self._dcm_frame_to_base_cache = self._dcm_cache
+        self._dcm_key = (ned_attitude.w_x, ned_attitude.w_y, ned_attitude.w_z, coordinates.COORD_DTYPE)
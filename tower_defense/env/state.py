@@ -37,9 +37,11 @@ TODOs:
 import numpy as np
 
 # Tool imports
+from env import coordinates
 from env.coordinates import CartesianPoint, CartesianVector
 from env.reference_frames import CartesianInertial, CartesianTranslatingFrame, CartesianStaticOffsetFrame
 from utils.events import Event, EventManager
+from utils.pool import CartesianPointPool
 
 
 class World:
@@ -48,6 +50,20 @@ class World:
     a reference to the sim's instantiation of this object.
     """
 
+    # Number of points the world's point pool can hold.
+    POINT_POOL_CAPACITY = 4096
+
+    # The default timestep events in the order fire_all_timestep_events fires them.
+    # Targets are executed/moved before the Towers.
+    TIMESTEP_EVENTS = (
+        'targets_pre_timestep',
+        'towers_pre_timestep',
+        'targets_timestep',
+        'towers_timestep',
+        'targets_post_timestep',
+        'towers_post_timestep',
+    )
+
     def __init__(self, world_config=None):
         """
         Instantiate the class.
@@ -61,19 +77,19 @@ class World:
         # Capture the world specific portion of the config.
         self._config = world_config
 
+        # Points and vectors for the objects in this world can be created in this pool,
+        # e.g. CartesianPoint(x=0., y=0., z=0., pool=world.point_pool), so they don't each
+        # allocate their own array. The pool's buffer mixes points, vectors and free rows,
+        # so don't transform it as a whole. Gather the rows of the points to transform by
+        # their slots instead, e.g. world.point_pool.buffer[[p.slot for p in points]].
+        self._point_pool = CartesianPointPool(capacity=self.POINT_POOL_CAPACITY, dtype=coordinates.COORD_DTYPE)
+
         # Define the default events.
-        self._events = EventManager(
-            targets_pre_timestep=Event(name='targets_pre_timestep'),
-            towers_pre_timestep=Event(name='towers_pre_timestep'),
-            targets_timestep=Event(name='targets_timestep'),
-            towers_timestep=Event(name='towers_timestep'),
-            targets_post_timestep=Event(name='targets_post_timestep'),
-            towers_post_timestep=Event(name='towers_post_timestep'),
-        )
+        self._events = EventManager(**{name: Event(name=name) for name in self.TIMESTEP_EVENTS})
 
         # Create the Inertial Frame of the World based on the config.
         if world_config is not None:
-            np.random.seed(world_config['random_seed'])
+            self._seed_random_number_generators(seed=world_config['random_seed'])
 
             self._inertial_frame = world_config['inertial_frame']['object']['instance']
 
@@ -88,7 +104,7 @@ class World:
                 self._events.add_event(name=name, event=event)
 
         else:
-            np.random.seed(42)
+            self._seed_random_number_generators(seed=42)
 
             # No config was provided. Provide a default Inertial Frame.
             self._inertial_frame = CartesianInertial()
@@ -104,6 +120,59 @@ class World:
             self._clock = 0.
             self._timestep = None
 
+        # Rebuild the pipeline whenever one of its events is replaced, e.g. via
+        # world.events.add_event('targets_timestep', Event(...)).
+        self._build_timestep_pipeline()
+        self._events.add_change_function(name='timestep_pipeline', function=self._on_event_changed)
+
+    def _seed_random_number_generators(self, seed: int):
+        """
+        Create this world's random number generator. Random draws in the sim should
+        use world.rng, e.g. world.rng.normal(...), which is faster than the legacy
+        global generator and isn't shared with any other World.
+
+        Args:
+            seed:       The seed of the random number generator.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        self._rng = np.random.default_rng(seed)
+
+        # The legacy global generator is still seeded for any code that draws from
+        # np.random directly.
+        np.random.seed(seed)
+
+    def _build_timestep_pipeline(self):
+        """
+        Build the tuple of the fire_ctx methods of the default timestep events, in the
+        order they fire, so that fire_all_timestep_events doesn't look each event up in
+        the EventManager every timestep. It is rebuilt by _on_event_changed when any of
+        those events is added, replaced, or removed. A removed event is skipped.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        self._timestep_pipeline = tuple(
+            self._events[name].fire_ctx for name in self.TIMESTEP_EVENTS if name in self._events
+        )
+
+    def _on_event_changed(self, name: str):
+        """
+        Called by the EventManager when an event is added, replaced, or removed.
+
+        Args:
+            name:       Name of the event that changed.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        if name in self.TIMESTEP_EVENTS:
+            self._build_timestep_pipeline()
+
     def add_object_to_world(self, name: str, obj):
         """
         Add an object to the world.
@@ -239,21 +308,19 @@ class World:
         related methods in sequence.
 
         Args:
-            **kwargs:   Input args to be passed to each set of events.
+            **kwargs:   Input args to be passed to each set of events, along with
+                        world=self as in event_fire.
 
         Returns:
             N/A - this method calls other functions.
         """
 
-        # Execute/Move Targets before the Towers.
-        self._events['targets_pre_timestep'].fire(**kwargs)
-        self._events['towers_pre_timestep'].fire(**kwargs)
-
-        self._events['targets_timestep'].fire(**kwargs)
-        self._events['towers_timestep'].fire(**kwargs)
+        # Build the input args once for all six events.
+        ctx = {'world': self, **kwargs}
 
-        self._events['targets_post_timestep'].fire(**kwargs)
-        self._events['towers_post_timestep'].fire(**kwargs)
+        # Execute/Move Targets before the Towers, see TIMESTEP_EVENTS.
+        for fire in self._timestep_pipeline:
+            fire(ctx)
 
     # Read-Only properties
     @property
@@ -276,6 +343,14 @@ class World:
     def events(self) -> EventManager:
         return self._events
 
+    @property
+    def rng(self) -> np.random.Generator:
+        return self._rng
+
+    @property
+    def point_pool(self) -> CartesianPointPool:
+        return self._point_pool
+
     @property
     def clock(self) -> float:
         return self._clock
@@ -0,0 +1,141 @@
+"""
+Module:
+    test_reference_frames.py
+
+Description:
+    This file holds the unit tests of the reference frame transforms.
+
+Usage:
+    python -m unittest unit_tests.env.test_reference_frames
+
+Notes:
+
+
+References:
+
+
+License:
+    https://creativecommons.org/licenses/by-nc-nd/4.0/
+    Attribution-NonCommercial-NoDerivatives 4.0 International (CC BY-NC-ND 4.0)
+    See LICENSE.txt
+
+"""
+
+"""
+Version History:
+    Original:
+        Gabe Spradlin | 14-Oct-2026
+"""
+
+"""
+TODOs:
+    1)
+"""
+
+# Standard library imports
+import unittest
+
+import numpy as np
+
+# Tool imports
+from env.coordinates import Attitude, CartesianPoint, CartesianVector
+from env.reference_frames import CartesianInertial, CartesianTranslatingRotatingFrame
+
+
+class TestVectorTransforms(unittest.TestCase):
+    """
+    Vectors, including the results of arithmetic on vectors, are only rotated by the
+    transforms while points are also translated.
+    """
+
+    def setUp(self):
+        attitude = Attitude(w_x=0.3, w_y=-0.2, w_z=1.1)
+        self.frame = CartesianTranslatingRotatingFrame(
+            base_frame=CartesianInertial(),
+            origin=CartesianPoint(x=10., y=-20., z=30.),
+            attitude=attitude,
+        )
+
+    def test_vector_arithmetic_stays_a_vector(self):
+        vector = CartesianVector(x=1., y=2., z=3.)
+
+        self.assertIsInstance(vector * 2, CartesianVector)
+        self.assertIsInstance(2 * vector, CartesianVector)
+        self.assertIsInstance(vector + vector, CartesianVector)
+        self.assertIsInstance(vector - vector, CartesianVector)
+
+    def test_scaled_vector_is_not_translated(self):
+        vector = CartesianVector(x=1., y=2., z=3.) * 2
+        expected = np.array([2., 4., 6.])
+
+        to_frame = self.frame.transform_point_in_base_frame_to_this_frame(vector)
+        self.assertIsInstance(to_frame, CartesianVector)
+        np.testing.assert_allclose(to_frame.as_vector, self.frame.dcm_base_to_frame @ expected, rtol=1e-5)
+
+        to_base = self.frame.transform_point_in_this_frame_to_base_frame(vector)
+        self.assertIsInstance(to_base, CartesianVector)
+        np.testing.assert_allclose(to_base.as_vector, self.frame.dcm_frame_to_base @ expected, rtol=1e-5)
+
+    def test_point_is_translated(self):
+        point = CartesianPoint(x=1., y=2., z=3.) * 2
+        expected = self.frame.dcm_base_to_frame @ (np.array([2., 4., 6.]) - self.frame.origin.as_vector)
+
+        to_frame = self.frame.transform_point_in_base_frame_to_this_frame(point)
+        self.assertNotIsInstance(to_frame, CartesianVector)
+        np.testing.assert_allclose(to_frame.as_vector, expected, rtol=1e-5, atol=1e-4)
+
+    def test_out_is_written_in_place(self):
+        point = CartesianPoint(x=1., y=2., z=3.)
+        expected = self.frame.transform_point_in_base_frame_to_this_frame(point).as_vector
+
+        out = CartesianPoint(x=0., y=0., z=0.)
+        result = self.frame.transform_point_in_base_frame_to_this_frame(point, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_allclose(out.as_vector, expected, rtol=1e-5)
+
+        # The point can be its own out, and the inverse transform brings it back.
+        self.frame.transform_point_in_this_frame_to_base_frame(out, out=out)
+        np.testing.assert_allclose(out.as_vector, point.as_vector, rtol=1e-5, atol=1e-4)
+
+
+class TestBatchTransforms(unittest.TestCase):
+    """
+    The batch transforms of (N, 3) arrays of points match the single-point transforms.
+    """
+
+    def setUp(self):
+        self.frame = CartesianTranslatingRotatingFrame(
+            base_frame=CartesianInertial(),
+            origin=CartesianPoint(x=10., y=-20., z=30.),
+            attitude=Attitude(w_x=0.3, w_y=-0.2, w_z=1.1),
+        )
+        self.points = np.random.default_rng(0).uniform(-100., 100., size=(16, 3)).astype(np.float32)
+
+    def test_batch_matches_single_points(self):
+        to_frame = self.frame.transform_points_in_base_frame_to_this_frame(self.points)
+        to_base = self.frame.transform_points_in_this_frame_to_base_frame(self.points)
+
+        for i, row in enumerate(self.points):
+            point = CartesianPoint.from_vector(row)
+            np.testing.assert_allclose(
+                to_frame[i],
+                self.frame.transform_point_in_base_frame_to_this_frame(point).as_vector,
+                rtol=1e-4, atol=1e-3
+            )
+            np.testing.assert_allclose(
+                to_base[i],
+                self.frame.transform_point_in_this_frame_to_base_frame(point).as_vector,
+                rtol=1e-4, atol=1e-3
+            )
+
+    def test_batch_round_trip_in_place(self):
+        points = self.points.copy()
+        out = self.frame.transform_points_in_base_frame_to_this_frame(points, out=points)
+        self.assertIs(out, points)
+
+        self.frame.transform_points_in_this_frame_to_base_frame(points, out=points)
+        np.testing.assert_allclose(points, self.points, rtol=1e-4, atol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
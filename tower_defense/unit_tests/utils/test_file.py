@@ -0,0 +1,106 @@
+"""
+Module:
+    test_file.py
+
+Description:
+    This file holds the unit tests of FileSearch.
+
+Usage:
+    python -m unittest unit_tests.utils.test_file
+
+Notes:
+
+
+References:
+
+
+License:
+    https://creativecommons.org/licenses/by-nc-nd/4.0/
+    Attribution-NonCommercial-NoDerivatives 4.0 International (CC BY-NC-ND 4.0)
+    See LICENSE.txt
+
+"""
+
+"""
+Version History:
+    Original:
+        Gabe Spradlin | 14-Oct-2026
+"""
+
+"""
+TODOs:
+    1)
+"""
+
+# Standard library imports
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# Tool imports
+from utils.file import FileSearch
+
+
+class TestDuplicateFileNames(unittest.TestCase):
+    """
+    When a file name is found more than once, results keeps the same file as the pathlib
+    rglob search it replaced, i.e. the last one rglob finds.
+    """
+
+    FILES = (
+        'x.py',
+        'a/x.py',
+        'a/y.py',
+        'a/b/x.py',
+        'a/b/y.py',
+        'a/c/x.py',
+        'd/x.py',
+        'd/e/f/x.py',
+    )
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.root = self._temp_dir.name
+        for name in self.FILES:
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Path(path).touch()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def assert_matches_rglob(self, file_pattern: str, **kwargs):
+        search = FileSearch(self.root, file_pattern, **kwargs)
+
+        # The last file rglob finds for each name.
+        expected = {path.name: path for path in Path(self.root).rglob(file_pattern)}
+
+        results = {name: pieces.path for name, pieces in search.results.items()}
+        self.assertEqual(results, expected)
+
+        # The rglob based search in FileSearch agrees as well.
+        obsolete = search._file_search_obsolete()
+        obsolete.pop('directories')
+        self.assertEqual(results, {name: pieces.path for name, pieces in obsolete.items()})
+
+    def test_serial_walk_keeps_rglob_winner(self):
+        for file_pattern in ('x.py', '*.py', 'b/*.py'):
+            with self.subTest(file_pattern=file_pattern):
+                self.assert_matches_rglob(file_pattern, parallel=False)
+
+    def test_parallel_walk_matches_serial_walk(self):
+        for file_pattern in ('x.py', '*.py', 'b/*.py'):
+            with self.subTest(file_pattern=file_pattern):
+                self.assert_matches_rglob(file_pattern, parallel=True)
+
+                serial = [(name, pieces.path_str) for name, pieces in FileSearch(self.root, file_pattern).iter_results]
+                parallel = [
+                    (name, pieces.path_str)
+                    for name, pieces in FileSearch(self.root, file_pattern, parallel=True).iter_results
+                ]
+                self.assertEqual(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,12 @@ TODOs:
     1)
 """
 
+from utils import angles
 from utils import strings
 from utils import file
 from utils import plotting_tools
+from utils import pool
+from utils import events
+
+# events_jit isn't imported here because it loads Numba. Import it directly where it is
+# used, i.e. from utils.events_jit import JitEvent.
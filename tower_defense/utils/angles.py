@@ -3,14 +3,15 @@ Module:
     angles.py
 
 Description:
-    <Short description, but thorough, of what is included in the file.>
+    This file holds angle related utilities, e.g. the Direction Cosine Matrix (DCM).
 
 Usage:
-    <from some_module import some_function>
-    <Provide a simple example for each class and function in the file.>
+    import utils
+    dcm = utils.angles.dcm(w_x=np.deg2rad(180.), w_y=0., w_z=0.)
 
 Notes:
-
+    Numba is optional and only imported on the first call to dcm (or warmup), so
+    importing utils doesn't pay for loading it.
 
 References:
 
@@ -34,6 +35,84 @@ TODOs:
 """
 
 # Standard library imports
-
+import numpy as np
 
 # Tool imports
+
+
+def _dcm_core(w_x: float, w_y: float, w_z: float) -> np.ndarray:
+    # The DCM written out element by element from sin/cos of each angle rather than
+    # multiplying the 3 single axis rotations together.
+    c_x, s_x = np.cos(w_x), np.sin(w_x)
+    c_y, s_y = np.cos(w_y), np.sin(w_y)
+    c_z, s_z = np.cos(w_z), np.sin(w_z)
+
+    dcm = np.empty((3, 3))
+    dcm[0, 0] = c_y * c_z
+    dcm[0, 1] = c_y * s_z
+    dcm[0, 2] = -s_y
+    dcm[1, 0] = s_x * s_y * c_z - c_x * s_z
+    dcm[1, 1] = s_x * s_y * s_z + c_x * c_z
+    dcm[1, 2] = s_x * c_y
+    dcm[2, 0] = c_x * s_y * c_z + s_x * s_z
+    dcm[2, 1] = c_x * s_y * s_z - s_x * c_z
+    dcm[2, 2] = c_x * c_y
+
+    return dcm
+
+
+def _load_dcm_core(w_x: float, w_y: float, w_z: float) -> np.ndarray:
+    # The first call to dcm lands here. Numba is imported now, rather than with the
+    # module, and _dcm_impl is replaced by the compiled _dcm_core so later calls go
+    # straight to it. Numba is optional. If it isn't installed the DCM is computed in
+    # plain python/numpy.
+    global _dcm_impl
+
+    try:
+        import numba
+    except ImportError:
+        _dcm_impl = _dcm_core
+    else:
+        # cache=True saves the compiled function to disk so only the first run pays
+        # the compile cost.
+        _dcm_impl = numba.njit(cache=True, fastmath=True)(_dcm_core)
+
+    return _dcm_impl(w_x, w_y, w_z)
+
+
+# The function dcm calls, see _load_dcm_core.
+_dcm_impl = _load_dcm_core
+
+
+def dcm(w_x: float, w_y: float, w_z: float, dtype: type = np.float64) -> np.ndarray:
+    """
+    The Direction Cosine Matrix (DCM) from a base frame to a frame rotated by the
+    provided angles. The rotation order is the one usually used for aircraft,
+    Yaw-Pitch-Roll, i.e. rotate about z by w_z, then y by w_y, then x by w_x.
+
+    Args:
+        w_x:        Rotation about the x-axis (roll). [rad]
+        w_y:        Rotation about the y-axis (pitch). [rad]
+        w_z:        Rotation about the z-axis (yaw). [rad]
+        dtype:      The numpy dtype of the returned DCM. Match it to the vectors being
+                    rotated so dcm @ vector isn't upcast.
+
+    Returns:
+        (np.ndarray) 3x3 DCM. A vector in the base frame is converted to the rotated
+                     frame by dcm @ vector.
+    """
+
+    # The sin/cos are always done in double precision then cast to the requested dtype.
+    return _dcm_impl(float(w_x), float(w_y), float(w_z)).astype(dtype, copy=False)
+
+
+def warmup():
+    """
+    Compile the Numba functions in this module now rather than on their first use.
+    With caching this is only slow the first time the sim is ever run.
+
+    Returns:
+        N/A
+    """
+
+    dcm(w_x=0., w_y=0., w_z=0.)
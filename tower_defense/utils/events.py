@@ -3,11 +3,15 @@ Module:
     events.py
 
 Description:
-    <Short description, but thorough, of what is included in the file.>
+    This file holds the Event and EventManager classes used to create the event
+    driven framework of the sim.
 
 Usage:
-    <from some_module import some_function>
-    <Provide a simple example for each class and function in the file.>
+    from utils.events import Event, EventManager
+
+    events = EventManager(targets_timestep=Event(name='targets_timestep'))
+    events['targets_timestep'].add_function(name='move', function=lambda world, **kwargs: None)
+    events['targets_timestep'].fire(world=world)
 
 Notes:
 
@@ -37,3 +41,232 @@ TODOs:
 
 
 # Tool imports
+import utils
+
+
+class Event:
+    """
+    This class holds a single Event and the functions executed when it fires.
+    """
+
+    def __init__(self, name: str):
+        """
+        Instantiate the class.
+
+        Args:
+            name:       A descriptive name for the Event.
+        """
+
+        self._name = name
+
+        # The functions by name, for adding and removing them.
+        self._functions = {}
+
+        # A snapshot of the functions used when the event fires. Looping over a tuple
+        # is cheaper than over the dict's values and this is done every timestep. It
+        # is rebuilt whenever a function is added or removed.
+        self._function_tuple = ()
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__} {self._name}:\n'
+        for name in self._functions:
+            output += utils.strings.formatted_line(f'{name}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}(', tab_level=1)
+        output += utils.strings.formatted_line(f'name={self._name},', tab_level=2)
+        output += utils.strings.formatted_line(f'functions={self.functions},', tab_level=2)
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
+
+    def add_function(self, name: str, function: callable):
+        """
+        Add a function to the functions executed when the event fires.
+
+        Args:
+            name:       Human-readable name/identifier of the function.
+            function:   The function to be called when the event fires.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._functions[name] = function
+        self._function_tuple = tuple(self._functions.values())
+
+    def remove_function(self, name: str):
+        """
+        Remove a function from the functions executed when the event fires.
+
+        Args:
+            name:       Human-readable name/identifier of the function.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        if name not in self._functions:
+            raise KeyError(f'{name} is not a function of the {self._name} event.')
+
+        del self._functions[name]
+        self._function_tuple = tuple(self._functions.values())
+
+    def fire(self, *args, **kwargs):
+        """
+        Execute every function of the event, in the order they were added.
+
+        Args:
+            *args:      Passed to every function.
+            **kwargs:   Passed to every function, e.g. world=world.
+
+        Returns:
+            N/A - this method calls other functions.
+        """
+
+        for function in self._function_tuple:
+            function(*args, **kwargs)
+
+    def fire_ctx(self, ctx: dict):
+        """
+        Execute every function of the event with the entries of ctx as keyword args.
+        This is fire for a caller firing several events with the same input args, e.g.
+        World.fire_all_timestep_events, since ctx is built once by the caller rather
+        than a new kwargs dict being built for every event.
+
+        Args:
+            ctx:        The keyword args for every function, e.g. {'world': world}.
+
+        Returns:
+            N/A - this method calls other functions.
+        """
+
+        for function in self._function_tuple:
+            function(**ctx)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def functions(self) -> list:
+        return list(self._functions.keys())
+
+
+class EventManager:
+    """
+    This class holds the named Events of the sim.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Instantiate the class.
+
+        Args:
+            **kwargs:   The Events to start with, e.g. targets_timestep=Event(...).
+        """
+
+        self._events = dict(kwargs)
+
+        # Functions called with the name of an event whenever it is added, replaced, or
+        # removed. Key: name of the function, Value: the function.
+        self._change_functions = {}
+
+    def __str__(self) -> str:
+        output = f'{self.__class__.__name__}:\n'
+        for name in self._events:
+            output += utils.strings.formatted_line(f'{name}', tab_level=1)
+
+        return output
+
+    def __repr__(self) -> str:
+        output = utils.strings.formatted_line(f'{self.__class__.__name__}(', tab_level=1)
+        output += utils.strings.formatted_line(f'events={self.events},', tab_level=2)
+        output += utils.strings.formatted_line(')', tab_level=1)
+
+        return output
+
+    def __getitem__(self, key: str) -> Event:
+        # Allow access via class_name['event'].
+        return self._events[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._events
+
+    def add_event(self, name: str, event: Event):
+        """
+        Add an event. An existing event with the same name is replaced.
+
+        Args:
+            name:       Human-readable name/identifier of the event.
+            event:      The instantiated Event.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._events[name] = event
+        self._fire_change_functions(name=name)
+
+    def remove_event(self, name: str):
+        """
+        Remove an event.
+
+        Args:
+            name:       Human-readable name/identifier of the event.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._events.pop(name, None)
+        self._fire_change_functions(name=name)
+
+    def add_change_function(self, name: str, function: callable):
+        """
+        Add a function to be called whenever an event is added, replaced, or removed,
+        e.g. so something holding on to an event's fire method can rebuild. The function
+        is called as function(name) with the name of the event that changed.
+
+        Args:
+            name:       Human-readable name/identifier of the function.
+            function:   The function to call.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._change_functions[name] = function
+
+    def remove_change_function(self, name: str):
+        """
+        Remove a function added by add_change_function.
+
+        Args:
+            name:       Human-readable name/identifier of the function.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        self._change_functions.pop(name, None)
+
+    def _fire_change_functions(self, name: str):
+        """
+        Call the change functions.
+
+        Args:
+            name:       Name of the event that was added, replaced, or removed.
+
+        Returns:
+            N/A - this method calls other functions.
+        """
+
+        for function in tuple(self._change_functions.values()):
+            function(name)
+
+    @property
+    def events(self) -> list:
+        return list(self._events.keys())
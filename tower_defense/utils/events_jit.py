@@ -0,0 +1,234 @@
+"""
+Module:
+    events_jit.py
+
+Description:
+    This file holds the JitEvent class, an Event whose callbacks can also be compiled
+    with Numba and called from compiled code rather than from the interpreter.
+
+Usage:
+    from utils.events_jit import JitEvent
+
+    def move(positions, velocities, timestep):
+        for i in range(positions.shape[0]):
+            for j in range(3):
+                positions[i, j] += velocities[i, j] * timestep
+
+    event = JitEvent(name='targets_timestep')
+    event.add_cfunc(name='move', function=move)
+    event.fire_jit(positions, velocities, timestep)
+
+Notes:
+    The callbacks all have the same signature,
+        callback(positions: np.ndarray, velocities: np.ndarray, timestep: float) -> None
+    where positions and velocities are C-contiguous (N, 3) arrays, e.g. the buffers of
+    two CartesianPointPools, and are updated in place.
+
+    Numba is optional. If it isn't installed the callbacks are kept as plain python
+    functions and fire_jit calls them in turn. Numba 0.56 through 0.68 is supported, see
+    simulations_environment_ubuntu2204.txt.
+
+References:
+    https://numba.readthedocs.io/en/stable/user/cfunc.html
+    https://numba.readthedocs.io/en/stable/reference/types.html#functions
+
+License:
+    https://creativecommons.org/licenses/by-nc-nd/4.0/
+    Attribution-NonCommercial-NoDerivatives 4.0 International (CC BY-NC-ND 4.0)
+    See LICENSE.txt
+
+"""
+
+"""
+Version History:
+    Original:
+        Gabe Spradlin | 14-Oct-2026
+"""
+
+"""
+TODOs:
+    1)
+"""
+
+# Standard library imports
+import warnings
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Tool imports
+from utils.events import Event
+
+
+def _compile_fire_cfuncs(cfuncs: tuple, signature) -> callable:
+    """
+    Compile a function that calls each of the cfuncs in turn without going back to the
+    interpreter.
+
+    The cfuncs are captured by the closure rather than passed as an argument, so their
+    first-class function types are only worked out while compiling. Numba warns that
+    these are experimental, so the warning is ignored here, the warning filters are left
+    as they were.
+
+    Args:
+        cfuncs:     Tuple of numba.cfunc callbacks, all with the given signature.
+        signature:  The Numba signature of the callbacks.
+
+    Returns:
+        (callable) The compiled function with the same signature as the callbacks.
+    """
+
+    def fire_cfuncs(positions, velocities, timestep):
+        for cfunc in cfuncs:
+            cfunc(positions, velocities, timestep)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            'ignore',
+            message='First-class function type feature is experimental',
+            category=numba.NumbaExperimentalFeatureWarning
+        )
+        # Giving the signature compiles it now, rather than on the next fire_jit, so a
+        # timestep never pays for the compile.
+        return numba.njit(signature)(fire_cfuncs)
+
+
+class JitEvent(Event):
+    """
+    This class holds an Event whose compiled callbacks are fired by fire_jit. The python
+    functions added with add_function are still fired by fire and fire_ctx as usual.
+    """
+
+    def __init__(self, name: str, dtype: type = np.float64):
+        """
+        Instantiate the class.
+
+        Args:
+            name:       A descriptive name for the Event.
+            dtype:      The numpy dtype of the positions and velocities arrays, e.g.
+                        env.coordinates.COORD_DTYPE to fire on a CartesianPointPool's
+                        buffer.
+        """
+
+        super().__init__(name=name)
+
+        self._dtype = np.dtype(dtype)
+
+        if numba is not None:
+            self._array_type = numba.from_dtype(self._dtype)[:, ::1]
+            self._signature = numba.void(self._array_type, self._array_type, numba.float64)
+        else:
+            self._array_type = None
+            self._signature = None
+
+        # Same as the python functions, a dict for adding/removing and a tuple for firing.
+        self._cfuncs = {}
+        self._cfunc_tuple = ()
+
+        # The compiled function calling the current callbacks, see _compile_fire.
+        self._fire_compiled = None
+
+    def add_cfunc(self, name: str, function: callable):
+        """
+        Add a callback fired by fire_jit. It is compiled to a cfunc with this event's
+        signature (see Notes at the top of the file) unless it already is one.
+
+        Args:
+            name:       Human-readable name/identifier of the callback.
+            function:   The callback, a python function Numba can compile in nopython
+                        mode or a numba.cfunc with this event's signature.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        # Compiled cfuncs have the address of their native function, python functions
+        # don't.
+        if numba is not None and not hasattr(function, 'address'):
+            try:
+                function = numba.cfunc(self._signature, cache=True)(function)
+            except RuntimeError:
+                # Functions without a source file, e.g. defined in an interactive session,
+                # can't be cached.
+                function = numba.cfunc(self._signature)(function)
+
+        self._cfuncs[name] = function
+        self._cfunc_tuple = tuple(self._cfuncs.values())
+        self._compile_fire()
+
+    def _compile_fire(self):
+        """
+        Compile the function fire_jit calls for the current callbacks.
+
+        Returns:
+            N/A - _fire_compiled is updated.
+        """
+
+        if numba is None or len(self._cfunc_tuple) == 0:
+            self._fire_compiled = None
+            return
+
+        self._fire_compiled = _compile_fire_cfuncs(cfuncs=self._cfunc_tuple, signature=self._signature)
+
+    def remove_cfunc(self, name: str):
+        """
+        Remove a callback fired by fire_jit.
+
+        Args:
+            name:       Human-readable name/identifier of the callback.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        if name not in self._cfuncs:
+            raise KeyError(f'{name} is not a cfunc of the {self._name} event.')
+
+        del self._cfuncs[name]
+        self._cfunc_tuple = tuple(self._cfuncs.values())
+        self._compile_fire()
+
+    def fire_jit(self, positions: np.ndarray, velocities: np.ndarray, timestep: float):
+        """
+        Call every callback added with add_cfunc, in the order they were added.
+
+        Args:
+            positions:  C-contiguous (N, 3) array of this event's dtype.
+            velocities: C-contiguous (N, 3) array of this event's dtype.
+            timestep:   The timestep of the sim. [s]
+
+        Returns:
+            N/A - the callbacks update positions and velocities in place.
+        """
+
+        if len(self._cfunc_tuple) == 0:
+            return
+
+        if numba is not None:
+            # The compiled function only checks the dtype and number of dimensions of
+            # the arrays, not that they are (N, 3), so check them here.
+            for array in (positions, velocities):
+                if (array.dtype != self._dtype or array.ndim != 2 or array.shape[1] != 3
+                        or not array.flags.c_contiguous):
+                    layout = 'C-contiguous' if array.flags.c_contiguous else 'non C-contiguous'
+                    raise ValueError(
+                        f'The {self._name} event fires on C-contiguous (N, 3) {self._dtype} arrays, '
+                        f'got a {layout} {array.shape} {array.dtype} array.'
+                    )
+
+            self._fire_compiled(positions, velocities, float(timestep))
+        else:
+            for function in self._cfunc_tuple:
+                function(positions, velocities, timestep)
+
+    @property
+    def cfuncs(self) -> list:
+        return list(self._cfuncs.keys())
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
@@ -31,43 +31,193 @@ TODOs:
 
 # Standard library imports
 import os
+import fnmatch
+import pickle
 from pathlib import Path
-from collections import namedtuple
+from collections import defaultdict
 from datetime import datetime
 import re
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
 # Tool imports
-from utils import strings
 
 
-file_pieces = namedtuple(
-    'file_pieces',
-    [
-        'path',
-        'parts',
-        'directory',
-    ]
-)
+class FilePieces:
+    """
+    This class holds the pieces of a file found by FileSearch. path_str is the path as
+    scandir built it from the search directory, e.g. './main.py' for '.', while path is
+    the normalized pathlib Path, e.g. Path('main.py').
+    """
+
+    # There is one of these per file found so they don't get a per-instance __dict__.
+    __slots__ = ('path_str', 'directory')
+
+    def __init__(self, path_str: str, directory: str):
+        """
+        Instantiate the class.
+
+        Args:
+            path_str:   The path of the file as a string, e.g. os.DirEntry.path.
+            directory:  The directory of the file, with a trailing separator.
+        """
+
+        self.path_str = path_str
+        self.directory = directory
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(path_str={self.path_str!r}, directory={self.directory!r})'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FilePieces):
+            return NotImplemented
+
+        return self.path_str == other.path_str and self.directory == other.directory
+
+    def __hash__(self) -> int:
+        # Hashable like the namedtuple this replaced.
+        return hash((self.path_str, self.directory))
+
+    @property
+    def path(self) -> Path:
+        # Most callers only need path_str, so the Path is only built when asked for.
+        return Path(self.path_str)
+
+    @property
+    def parts(self) -> tuple:
+        return self.path.parts
+
+
+# The original name of FilePieces, when it was a namedtuple.
+file_pieces = FilePieces
 
 
 class FileSearch:
     """
-
+    This class recursively searches a directory for files matching a pattern.
+
+    By default every FileSearch walks the file system. With use_cache the results are
+    cached in the process, so FileSearch instances for the same directory and pattern
+    share one search, and with cache_path they are also cached on disk between runs.
+    A cached result is reused while the search directory's modification time is
+    unchanged. That time only changes when an entry directly in the search directory
+    is added, removed, or renamed, so only cache searches of trees that don't change
+    below the top level, or clear_cache (and delete cache_path) after changes deeper
+    in the tree.
     """
 
-    def __init__(self, search_directory: str, file_pattern: str):
+    # Bump this when the layout of the results changes so old caches on disk are ignored.
+    _CACHE_VERSION = 3
+
+    # The in-process cache shared by every instance. Key: see _cache_key, Value: results.
+    _cache = {}
+
+    # The most searches kept in the in-process cache and in a cache_path file. The
+    # oldest search is dropped to make room for a new one.
+    _CACHE_MAX_ENTRIES = 32
+
+    def __init__(self, search_directory: str, file_pattern: str, cache_path: [str, None] = None,
+                 parallel: bool = False, use_cache: bool = False):
         """
 
         Args:
-            search_directory:
-            file_pattern:
+            search_directory:   The directory to search, including its subdirectories.
+            file_pattern:       The glob style pattern file names must match, e.g. '*.py'.
+                                Like pathlib's rglob, it can include the directories the
+                                file must be in, e.g. 'data/*.csv' matches any csv file
+                                directly in a directory named data at any depth. Absolute
+                                patterns and '**' other than at the start aren't supported
+                                and raise a ValueError.
+            cache_path:         Path of a pickle file the results are cached in between
+                                runs. Providing it turns on use_cache.
+            parallel:           Search each subdirectory of search_directory in its own
+                                thread. This overlaps the file system calls, which helps
+                                most on network file systems where each call is slow. It
+                                is off by default since for small local trees starting
+                                the threads costs more than it saves, see
+                                _scandir_parallel for its limits. The results are the
+                                same either way.
+            use_cache:          Reuse the results of an identical search done earlier in
+                                this process, see the class docstring for when they go
+                                stale. Without it, or cache_path, every instance searches
+                                the file system.
         """
 
         self._search_directory = search_directory
         self._file_pattern = file_pattern
+        self._cache_path = cache_path
+        self._parallel = parallel
+        self._use_cache = use_cache or cache_path is not None
+
+        # Split the pattern into the file name's pattern and the patterns of the
+        # directories it must be in, e.g. 'data/*.csv' -> '*.csv' in 'data'.
+        separators = re.escape(os.sep + (os.altsep or ''))
+        pattern_parts = re.split(f'[{separators}]', file_pattern)
+        if pattern_parts[0] == '' and len(pattern_parts) > 1:
+            raise ValueError(f'file_pattern must be relative, got {file_pattern!r}')
+
+        # The search is already recursive, so leading '**' directories change nothing.
+        pattern_parts = [part for part in pattern_parts if part != '']
+        while len(pattern_parts) > 1 and pattern_parts[0] == '**':
+            pattern_parts.pop(0)
+
+        if len(pattern_parts) == 0 or '**' in pattern_parts:
+            raise ValueError(f'file_pattern must name files and only start with **, got {file_pattern!r}')
+
+        self._name_matches = self._compile_name_pattern(pattern_parts[-1])
+        self._directory_matches = tuple(self._compile_name_pattern(part) for part in pattern_parts[:-1])
+
+        # scandir builds the paths of the entries by appending to the search directory, so
+        # this prefix is removed to get a file's path relative to the search directory.
+        self._search_prefix = os.path.join(search_directory, '')
         self._results = None
 
+    @staticmethod
+    def _compile_name_pattern(pattern: str):
+        """
+        Build the function used to check a file or directory name against one part of the
+        file pattern. A pattern without glob wildcards is a single exact name, so the
+        names are compared directly rather than using a regex. Otherwise the glob pattern
+        is translated to a regex once rather than for every name checked.
+
+        Args:
+            pattern:        The glob style pattern of a name, e.g. '*.py'.
+
+        Returns:
+            (function)      Takes a name, returns whether it matches (truthy) or not.
+        """
+
+        if any(c in pattern for c in '*?['):
+            return re.compile(fnmatch.translate(pattern)).match
+
+        return pattern.__eq__
+
+    def _matches(self, entry: os.DirEntry) -> bool:
+        """
+        Check whether a file matches the file pattern, including the directories it is in
+        if the pattern names any.
+
+        Args:
+            entry:          The file.
+
+        Returns:
+            (bool)          True if the file matches.
+        """
+
+        if not self._name_matches(entry.name):
+            return False
+
+        if len(self._directory_matches) == 0:
+            return True
+
+        # The directories between the search directory and the file, the innermost last.
+        directories = entry.path[len(self._search_prefix):].split(os.sep)[:-1]
+        if len(directories) < len(self._directory_matches):
+            return False
+
+        innermost = directories[len(directories) - len(self._directory_matches):]
+        return all(matches(name) for matches, name in zip(self._directory_matches, innermost))
+
     def _file_search_obsolete(self) -> dict:
         """
         This function recursively searches a directory for files matching a
@@ -78,53 +228,296 @@ class FileSearch:
                             containing the information provided by the Path library.
         """
 
-        output = {'directories': {}}
+        # Many files share a directory. Interning the directory strings in this dict makes
+        # those files share one string object rather than each holding its own copy.
+        dir_intern = {}
+
+        # Key: directory, Value: list of the names of the files in it.
+        directories = defaultdict(list)
+
+        output = {'directories': directories}
         for path in Path(self._search_directory).rglob(self._file_pattern):
-            file_directory = ''
-            for p in path.parts[:-1]:
-                file_directory += p + os.sep
-
-            output[path.name] = file_pieces(
-                path=path,
-                parts=path.parts,
-                directory=strings.deduplicate(file_directory, os.sep),
+            # The directory with a trailing separator. pathlib has already normalized the
+            # path so there are no doubled separators to remove.
+            file_directory = os.path.join(os.path.dirname(str(path)), '')
+            file_directory = dir_intern.setdefault(file_directory, file_directory)
+
+            output[path.name] = FilePieces(
+                path_str=str(path),
+                directory=file_directory,
             )
 
-            file_dir = output[path.name].directory
-            if file_dir not in output['directories']:
-                output['directories'][file_dir] = []
-
-            output['directories'][file_dir].append(path.name)
+            directories[file_directory].append(path.name)
 
+        # A plain dict so looking up a directory that isn't there still raises KeyError.
+        output['directories'] = dict(directories)
         return output
 
+    def _scan_directory(self, path: str) -> tuple:
+        """
+        List one directory with os.scandir. The DirEntry objects carry the file type from
+        the directory listing so, unlike pathlib's rglob, no extra stat call is needed per
+        entry. Symlinks are skipped and a directory that can't be read is treated as empty.
+
+        Args:
+            path:           The directory to list.
+
+        Returns:
+            (tuple)         (list of os.DirEntry of the matching files, list of the paths
+                            of the subdirectories), both in listing order.
+        """
+
+        files = []
+        subdirectories = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        continue
+
+                    if entry.is_dir():
+                        subdirectories.append(entry.path)
+                    elif entry.is_file() and self._matches(entry):
+                        files.append(entry)
+
+        except (PermissionError, FileNotFoundError):
+            pass
+
+        return files, subdirectories
+
+    def _scandir_recursive(self, path: str):
+        """
+        Recursively walk a directory, yielding the files whose names match the file
+        pattern. Like pathlib's rglob, a directory's own files are yielded before any of
+        its subdirectories are walked, so when a file name is found more than once the
+        file results keeps (the last one) is the same as with rglob.
+
+        Args:
+            path:           The directory to search.
+
+        Returns:
+            (generator)     os.DirEntry of each matching file.
+        """
+
+        files, subdirectories = self._scan_directory(path)
+        yield from files
+
+        for subdirectory in subdirectories:
+            yield from self._scandir_recursive(subdirectory)
+
+    def _scandir_parallel(self, path: str):
+        """
+        The same walk as _scandir_recursive, but each subdirectory of path is walked in
+        a thread pool. The top level files are yielded first and then the files of each
+        subdirectory, in the order the subdirectories are listed rather than the order
+        the threads finish, so the files are yielded in the same order as
+        _scandir_recursive.
+
+        Only the top level subdirectories are spread over the threads, each is walked
+        entirely by one thread. A tree whose files are mostly under one subdirectory
+        therefore gets little from the threads.
+
+        Args:
+            path:           The directory to search.
+
+        Returns:
+            (generator)     os.DirEntry of each matching file.
+        """
+
+        files, subdirectories = self._scan_directory(path)
+        if len(subdirectories) < 2:
+            # Nothing to overlap, so don't start the threads.
+            yield from files
+            for subdirectory in subdirectories:
+                yield from self._scandir_recursive(subdirectory)
+
+            return
+
+        def walk(directory: str) -> list:
+            return list(self._scandir_recursive(directory))
+
+        executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(subdirectories)))
+        try:
+            walks = [executor.submit(walk, subdirectory) for subdirectory in subdirectories]
+
+            yield from files
+            for future in walks:
+                yield from future.result()
+
+        finally:
+            # Don't start the walks that are still queued if the caller stopped early.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_file_search(self):
+        """
+        This function recursively searches a directory for files matching a
+        provided pattern, yielding each file as it is found.
+
+        Returns:
+            (generator)     (File name w/o path, FilePieces containing the
+                            information provided by the Path library) of each file.
+        """
+
+        # Key: directory as listed by scandir, Value: the directory normalized by pathlib
+        # with a trailing separator. Files in the same directory share the one string, see
+        # _file_search_obsolete, and pathlib only runs once per directory.
+        directories = {}
+
+        if self._parallel:
+            entries = self._scandir_parallel(self._search_directory)
+        else:
+            entries = self._scandir_recursive(self._search_directory)
+
+        for entry in entries:
+            listed_directory = os.path.dirname(entry.path)
+            file_directory = directories.get(listed_directory)
+            if file_directory is None:
+                # The path scandir built keeps any doubled separators, '.', etc. of the
+                # search directory, so take the directory of the normalized path as the
+                # Path did before.
+                file_directory = os.path.join(os.path.dirname(str(Path(entry.path))), '')
+                directories[listed_directory] = file_directory
+
+            yield entry.name, FilePieces(
+                path_str=entry.path,
+                directory=file_directory,
+            )
+
     def _file_search(self) -> dict:
         """
         This function recursively searches a directory for files matching a
         provided pattern.
 
         Returns:
-            (dict)          Dict with Key: File name w/o path, Value: file_pieces namedtuple
+            (dict)          Dict with Key: File name w/o path, Value: FilePieces
                             containing the information provided by the Path library.
         """
 
-        output = {}
-        for path in Path(self._search_directory).rglob(self._file_pattern):
-            file_directory = ''
-            for p in path.parts[:-1]:
-                file_directory += p + os.sep
-
-            output[path.name] = file_pieces(
-                path=path,
-                parts=path.parts,
-                directory=strings.deduplicate(file_directory, os.sep),
-            )
+        return dict(self._iter_file_search())
 
-        return output
+    def _cache_key(self) -> [tuple, None]:
+        """
+        The key of this search in the caches.
+
+        Returns:
+            (tuple)         (version, absolute search directory, search directory as
+                            provided, file pattern, search directory mtime) or None if
+                            the search directory can't be stat'ed, in which case the
+                            results aren't cached. The search directory as provided is
+                            included because the paths in the results are built from it.
+        """
+
+        search_directory = os.path.abspath(self._search_directory)
+        try:
+            mtime = os.stat(search_directory).st_mtime_ns
+        except OSError:
+            return None
+
+        return self._CACHE_VERSION, search_directory, self._search_directory, self._file_pattern, mtime
+
+    def _load_disk_cache(self) -> dict:
+        """
+        Load the searches cached at cache_path.
+
+        Returns:
+            (dict)          Key: see _cache_key, Value: results. Empty if there is no cache
+                            file or it can't be read.
+        """
+
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_disk_cache(self, key: tuple, results: dict):
+        """
+        Add a search to the cache at cache_path. The file is replaced in one step so an
+        interrupted write doesn't leave a corrupt cache behind.
+
+        Args:
+            key:            See _cache_key.
+            results:        The results of the search.
+
+        Returns:
+            N/A - the cache file is written.
+        """
+
+        cache = self._load_disk_cache()
+        cache.pop(key, None)
+        cache[key] = results
+        self._trim_cache(cache)
+
+        temp_path = f'{self._cache_path}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, self._cache_path)
+        except OSError:
+            # Caching is an optimization, the search results are still valid.
+            pass
+
+    @classmethod
+    def _trim_cache(cls, cache: dict):
+        """
+        Drop the oldest searches from a cache so it holds no more than _CACHE_MAX_ENTRIES.
+        The caches are dicts so their oldest entries are the first ones.
+
+        Args:
+            cache:          The cache to trim.
+
+        Returns:
+            N/A - the cache is updated.
+        """
+
+        while len(cache) > cls._CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget the searches cached in this process.
+
+        Returns:
+            N/A - class variables are updated.
+        """
+
+        cls._cache.clear()
+
+    @property
+    def iter_results(self):
+        # A new generator of (file name, FilePieces) on every access. The search runs as
+        # the generator is consumed so a caller after the first match can stop early. It
+        # always searches the file system, i.e. it doesn't use the caches, and unlike
+        # results a file name found more than once is yielded each time.
+        return self._iter_file_search()
 
     @property
     def results(self) -> dict:
-        if self._results is None:
+        # Note with use_cache the results are shared with any other FileSearch of the
+        # same search so they shouldn't be modified.
+        if self._results is not None:
+            return self._results
+
+        key = self._cache_key() if self._use_cache else None
+        if key is None:
             self._results = self._file_search()
+            return self._results
+
+        results = self._cache.get(key)
+        if results is None and self._cache_path is not None:
+            results = self._load_disk_cache().get(key)
+
+        if results is None:
+            results = self._file_search()
+            if self._cache_path is not None:
+                self._save_disk_cache(key=key, results=results)
 
+        self._cache.pop(key, None)
+        self._cache[key] = results
+        self._trim_cache(self._cache)
+        self._results = results
         return self._results
@@ -13,6 +13,10 @@ Usage:
     # valid kwargs.
     set_axes_options(ax=ax, **kwargs) 
     
+    # Neither set_axes_options nor set_label_rotation run tight_layout by default. Call it
+    # once after all of the figure's axes are set.
+    fig.tight_layout()
+    
     # DEFAULT_FIGURE_SIZE is a constant.
 
 Notes:
@@ -41,7 +45,15 @@ import numpy as np
 # Custom Package Imports
 
 
-plt.style.use('fivethirtyeight')
+# The style of the figures. It is applied by _ensure_style when the first figure is
+# created rather than on import, since plt.style.use parses the style sheet and changes
+# matplotlib's global rcParams even for code that never plots.
+PLOT_STYLE = 'fivethirtyeight'
+_style_applied = False
+
+# Figures kept for reuse by the create_new_figure* functions when they are given a
+# pool_key. Key: (pool_key, layout of the figure), Value: the dict the function returned.
+_FIG_POOL = {}
 
 DEFAULT_FIGURE_SIZE = (14, 8)
 DEFAULT_PLOT_COLORS = [
@@ -76,23 +88,119 @@ DEFAULT_PLOT_COLORS = [
 ]
 
 
-def create_new_figure(figsize: tuple = DEFAULT_FIGURE_SIZE, is_3d: bool = False) -> dict:
+def _ensure_style():
+    # Apply PLOT_STYLE the first time this is called.
+    global _style_applied
+    if _style_applied is False:
+        plt.style.use(PLOT_STYLE)
+        _style_applied = True
+
+
+def _clear_axes(ax):
+    # Remove what was plotted on an axes so it can be reused. This is used rather than
+    # ax.cla(), which rebuilds the axes and costs as much as creating a new one. The
+    # data, legend, title, and labels are removed, the color cycle is restarted, and
+    # the limits go back to autoscaling. Other settings, e.g. fixed ticks or the axes
+    # position, carry over.
+    for artist in (*ax.lines, *ax.collections, *ax.patches, *ax.texts, *ax.images, *ax.tables, *ax.artists):
+        artist.remove()
+
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+
+    ax.set_title('')
+    ax.set_xlabel('')
+    ax.set_ylabel('')
+    if hasattr(ax, 'set_zlabel'):
+        ax.set_zlabel('')
+
+    ax.set_prop_cycle(None)
+    ax.relim()
+    ax.autoscale(enable=True)
+
+
+def _reuse_pooled_figure(key: [tuple, None]) -> [dict, None]:
+    # Return the pooled figure for key with all of its axes cleared, or None if there
+    # isn't one. A pooled figure that has since been closed is dropped.
+    if key is None:
+        return None
+
+    figure = _FIG_POOL.get(key)
+    if figure is None:
+        return None
+
+    if not plt.fignum_exists(figure['fig'].number):
+        del _FIG_POOL[key]
+        return None
+
+    for ax in figure['fig'].axes:
+        _clear_axes(ax)
+
+    return figure
+
+
+def _add_to_figure_pool(key: [tuple, None], figure: dict) -> dict:
+    # Keep a newly created figure for reuse if it has a key.
+    if key is not None:
+        _FIG_POOL[key] = figure
+
+    return figure
+
+
+def clear_figure_pool():
+    """
+    Close every pooled figure and empty the pool.
+
+    Returns:
+        N/A - the figures are closed.
+    """
+
+    for figure in _FIG_POOL.values():
+        plt.close(figure['fig'])
+
+    _FIG_POOL.clear()
+
+
+def create_new_figure(
+        figsize: tuple = DEFAULT_FIGURE_SIZE,
+        is_3d: bool = False,
+        pool_key: [str, None] = None
+) -> dict:
     # This function simply creates a new figure with the provided size.
+    # If a pool_key is provided the figure is kept and, when this is next called with
+    # the same pool_key and layout, returned again with its axes cleared. This is much
+    # faster when redrawing the same figure with new data, e.g. in a parameter sweep.
+    # See _clear_axes for what is and isn't reset.
+    key = None if pool_key is None else (pool_key, 'figure', tuple(figsize), is_3d)
+    figure = _reuse_pooled_figure(key)
+    if figure is not None:
+        return figure
+
+    _ensure_style()
     if is_3d is False:
         fig, ax = plt.subplots(figsize=figsize)
     else:
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(projection='3d')
 
-    return {'fig': fig, 'ax': ax}
+    return _add_to_figure_pool(key, {'fig': fig, 'ax': ax})
 
 
 def create_new_figure_with_1_column_of_axes(
         number_of_axes: int = 1,
-        figsize: tuple = DEFAULT_FIGURE_SIZE
+        figsize: tuple = DEFAULT_FIGURE_SIZE,
+        pool_key: [str, None] = None
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single column, meaning 1 is above the other.
+    # See create_new_figure for pool_key.
+    key = None if pool_key is None else (pool_key, 'column', number_of_axes, tuple(figsize))
+    figure = _reuse_pooled_figure(key)
+    if figure is not None:
+        return figure
+
+    _ensure_style()
     fig, axs = plt.subplots(figsize=figsize, nrows=number_of_axes)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
@@ -101,15 +209,23 @@ def create_new_figure_with_1_column_of_axes(
     for index, ax in enumerate(axs):
         output[f'row{index}'] = ax
 
-    return output
+    return _add_to_figure_pool(key, output)
 
 
 def create_new_figure_with_1_row_of_axes(
         number_of_axes: int = 1,
-        figsize: tuple = DEFAULT_FIGURE_SIZE
+        figsize: tuple = DEFAULT_FIGURE_SIZE,
+        pool_key: [str, None] = None
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single row, meaning 1 is to the left of the other.
+    # See create_new_figure for pool_key.
+    key = None if pool_key is None else (pool_key, 'row', number_of_axes, tuple(figsize))
+    figure = _reuse_pooled_figure(key)
+    if figure is not None:
+        return figure
+
+    _ensure_style()
     fig, axs = plt.subplots(figsize=figsize, ncols=number_of_axes)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
@@ -118,34 +234,68 @@ def create_new_figure_with_1_row_of_axes(
     for index, ax in enumerate(axs):
         output[f'col{index}'] = ax
 
-    return output
+    return _add_to_figure_pool(key, output)
 
 
 def create_new_figure_with_grid_of_axes(
         number_of_rows: int = 1,
         number_of_cols: int = 1,
-        figsize: tuple = DEFAULT_FIGURE_SIZE
+        figsize: tuple = DEFAULT_FIGURE_SIZE,
+        pool_key: [str, None] = None
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single row, meaning 1 is to the left of the other.
+    # See create_new_figure for pool_key.
+    key = None if pool_key is None else (pool_key, 'grid', number_of_rows, number_of_cols, tuple(figsize))
+    figure = _reuse_pooled_figure(key)
+    if figure is not None:
+        return figure
+
+    _ensure_style()
     fig, axs = plt.subplots(figsize=figsize, ncols=number_of_cols, nrows=number_of_rows)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
     # more useful names.
+    # plt.subplots returns a single axes for a 1x1 grid and a 1D array for 1xN and Nx1
+    # grids so the axes are reshaped to the grid before being named.
     output = {'fig': fig, 'all_axes': axs}
-    for row in range(number_of_rows):
-        for col in range(number_of_cols):
-            output[f'row{row}_col{col}'] = axs[row, col]
-
-    return output
-
-
-def set_axes_options(ax, **kwargs):
+    grid = np.reshape(axs, (number_of_rows, number_of_cols))
+    output.update({f'row{row}_col{col}': ax for (row, col), ax in np.ndenumerate(grid)})
+
+    return _add_to_figure_pool(key, output)
+
+
+# The options set_axes_options applies via ax.update, i.e. ax.set_<option>(value), in
+# the order they are applied. 3D axes also have the z-axis options.
+_AXES_OPTIONS_2D = (
+    'yticks',
+    'xticks',
+    'yticklabels',
+    'xticklabels',
+    'ylabel',
+    'xlabel',
+    'ylim',
+    'xlim',
+    'title',
+    'position',
+)
+_AXES_OPTIONS_3D = _AXES_OPTIONS_2D + (
+    'zticks',
+    'zticklabels',
+    'zlabel',
+    'zlim',
+)
+
+
+def set_axes_options(ax, apply_tight_layout: bool = False, **kwargs):
     """
     This method provides a simple, all in one, place for altering the matplotlib plot.
 
     Args:
         ax:                 Handle to an existing axes object.
+        apply_tight_layout: If True the figure's tight_layout is run afterwards. It's
+                            expensive, so when setting up several axes leave this False
+                            and call fig.tight_layout() once after all of them are set.
         kwargs:             The kwargs are how you pass in other parameters like ylabel. The available options are:
                                 options = {
                                     'yticks': ax.set_yticks,
@@ -174,54 +324,16 @@ def set_axes_options(ax, **kwargs):
         N/A - alterations are made inplace and directly to the axes provided.
     """
 
-    ax.grid('on')
-
-    options = {
-        'yticks': ax.set_yticks,
-        'xticks': ax.set_xticks,
-        'yticklabels': ax.set_yticklabels,
-        'xticklabels': ax.set_xticklabels,
-        'ylabel': ax.set_ylabel,
-        'xlabel': ax.set_xlabel,
-        'ylim': ax.set_ylim,
-        'xlim': ax.set_xlim,
-        'title': ax.set_title,
-        'legend': ax.legend,
-        'position': ax.set_position,
-    }
-    
-    try:
-        options['zticks'] = ax.set_zticks
-    except AttributeError:
-        # The axes object doesn't include a z, therefore we ignore the z
-        # axis properties.
-        pass
-    
-    try:
-        options['zticklabels'] = ax.set_zticklabels
-    except AttributeError:
-        # The axes object doesn't include a z, therefore we ignore the z
-        # axis properties.
-        pass
-    
-    try:
-        options['zlabel'] = ax.set_zlabel
-    except AttributeError:
-        # The axes object doesn't include a z, therefore we ignore the z
-        # axis properties.
-        pass
-    
-    try:
-        options['zlim'] = ax.set_zlim
-    except AttributeError:
-        # The axes object doesn't include a z, therefore we ignore the z
-        # axis properties.
-        pass
-    
-    # Loop through the options.
-    for option, function in options.items():
-        if option in kwargs:
-            function(kwargs[option])
+    ax.grid(True)
+
+    # Pick the options this axes supports and apply them all in one ax.update call, in
+    # the order of the options tuple, e.g. the ticks are set before their labels.
+    options = _AXES_OPTIONS_3D if hasattr(ax, 'set_zlabel') else _AXES_OPTIONS_2D
+    ax.update({option: kwargs[option] for option in options if option in kwargs})
+
+    # legend isn't a property with a set_legend method so it is applied on its own.
+    if 'legend' in kwargs:
+        ax.legend(kwargs['legend'])
 
     if 'az' in kwargs:
         ax.azim = kwargs['az']
@@ -229,10 +341,11 @@ def set_axes_options(ax, **kwargs):
     if 'el' in kwargs:
         ax.elev = kwargs['el']
 
-    ax.figure.tight_layout()
+    if apply_tight_layout is True:
+        ax.figure.tight_layout()
 
 
-def set_label_rotation(ax, axis: str = 'x', rotation: float = 45.):
+def set_label_rotation(ax, axis: str = 'x', rotation: float = 45., apply_tight_layout: bool = False):
     """
     This function allows the user to rotate the labels on any plot axis.
 
@@ -240,6 +353,8 @@ def set_label_rotation(ax, axis: str = 'x', rotation: float = 45.):
         ax:             Axes object handle where the data and tickmarks already exist.
         axis:           The axis - x, y, or z - where the labels should be rotated.
         rotation:       The desired rotation of the labels. [deg]
+        apply_tight_layout: If True the figure's tight_layout is run afterwards, see
+                        set_axes_options.
 
     Returns:
         N/A - the axes object (ax) is manipulated directly.
@@ -250,17 +365,18 @@ def set_label_rotation(ax, axis: str = 'x', rotation: float = 45.):
     if abs(rotation) > 180.:
         raise ValueError(f'Valid rotations are between [-180, +180] degrees.')
 
-    if axis == 'x':
-        ticklabels = ax.get_xticklabels
-    elif axis == 'y':
-        ticklabels = ax.get_yticklabels
-    elif axis == 'z':
-        ticklabels = ax.get_xticklabels
-    else:
+    # 2D axes have no z tick labels, in which case 'z' is not recognized either.
+    get_ticklabels = {
+        'x': ax.get_xticklabels,
+        'y': ax.get_yticklabels,
+        'z': getattr(ax, 'get_zticklabels', None),
+    }
+    ticklabels = get_ticklabels.get(axis)
+    if ticklabels is None:
         raise ValueError(f'Axis value {axis} is not recognized.')
 
-    for tick in ticklabels():
-        tick.set_rotation(rotation)
-        tick.set_ha('right')
+    # Set both properties of every label in one call.
+    plt.setp(ticklabels(), rotation=rotation, horizontalalignment='right')
 
-    ax.figure.tight_layout()
+    if apply_tight_layout is True:
+        ax.figure.tight_layout()
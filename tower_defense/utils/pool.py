@@ -0,0 +1,133 @@
+"""
+Module:
+    pool.py
+
+Description:
+    This file holds the CartesianPointPool class. The pool pre-allocates a single
+    contiguous (N, 3) buffer and hands out rows of it so Cartesian points don't each
+    allocate their own small numpy array.
+
+Usage:
+    from utils.pool import CartesianPointPool
+
+    pool = CartesianPointPool(capacity=1024)
+    slot = pool.acquire()
+    vector = pool.view(slot)        # (3,) view into the pool's buffer.
+    pool.release(slot)
+
+Notes:
+    The slot's owner, e.g. a CartesianPoint, is the only thing that may use its view.
+    Once the slot is released it is handed out again and the memory is overwritten, so
+    owners must not hand the view out, e.g. CartesianPoint.as_vector returns a copy.
+    Batch operations on buffer only borrow the memory for the duration of the call.
+
+References:
+
+
+License:
+    https://creativecommons.org/licenses/by-nc-nd/4.0/
+    Attribution-NonCommercial-NoDerivatives 4.0 International (CC BY-NC-ND 4.0)
+    See LICENSE.txt
+
+"""
+
+"""
+Version History:
+    Original:
+        Gabe Spradlin | 14-Oct-2026
+"""
+
+"""
+TODOs:
+    1)
+"""
+
+# Standard library imports
+import numpy as np
+
+# Tool imports
+
+
+class CartesianPointPool:
+    """
+    This class holds a pre-allocated buffer of Cartesian [x, y, z] rows.
+    """
+
+    def __init__(self, capacity: int = 1024, dtype: type = np.float64):
+        """
+        Instantiate the class.
+
+        Args:
+            capacity:   The number of points the pool can hold at once.
+            dtype:      The numpy dtype of the buffer.
+        """
+
+        self._buffer = np.zeros((capacity, 3), dtype=dtype)
+
+        # Build the (3,) view of every slot once. Handing one out is then a list
+        # lookup rather than creating a new array object.
+        self._views = [self._buffer[slot] for slot in range(capacity)]
+
+        # Free slots are popped off the end, so reverse them to hand out slot 0 first.
+        self._free = list(range(capacity - 1, -1, -1))
+
+        # Whether each slot is currently handed out, to catch a slot released twice.
+        self._in_use = [False] * capacity
+
+    def acquire(self) -> [int, None]:
+        """
+        Take a free slot from the pool.
+
+        Returns:
+            (int)       The index of the slot or None if the pool is full.
+        """
+
+        if len(self._free) == 0:
+            return None
+
+        slot = self._free.pop()
+        self._in_use[slot] = True
+        return slot
+
+    def release(self, slot: int):
+        """
+        Give a slot back to the pool so it can be handed out again. Only the slot's owner
+        should release it, once it is done with the slot's memory, see the Notes above.
+
+        Args:
+            slot:       The index of the slot returned by acquire.
+
+        Returns:
+            N/A - instance variables are updated.
+        """
+
+        if not self._in_use[slot]:
+            raise ValueError(f'Slot {slot} is not in use, it was already released or never acquired.')
+
+        self._in_use[slot] = False
+        self._free.append(slot)
+
+    def view(self, slot: int) -> np.ndarray:
+        """
+        The memory of a slot as a (3,) vector.
+
+        Args:
+            slot:       The index of the slot returned by acquire.
+
+        Returns:
+            (np.ndarray) A view into the pool's buffer. Writing to it writes to the pool.
+        """
+
+        return self._views[slot]
+
+    @property
+    def buffer(self) -> np.ndarray:
+        return self._buffer
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.shape[0]
+
+    @property
+    def available(self) -> int:
+        return len(self._free)
@@ -29,20 +29,48 @@ TODOs:
 """
 
 # Standard library imports
+import os
+import re
 import numpy as np
 
 # Tool imports
 
 
+# The pattern matching runs of 2+ path separators, the most common use of deduplicate.
+_SEP_RE = re.compile(f'(?:{re.escape(os.sep)}){{2,}}')
+
+# The compiled deduplicate patterns. Key: needle, Value: (pattern, replacement). The
+# backslashes of the replacement are escaped so they aren't read as escapes, e.g. os.sep
+# on Windows.
+_DEDUPLICATE_PATTERNS = {os.sep: (_SEP_RE, os.sep.replace('\\', '\\\\'))}
+
+
+# The tabs of each indentation level used by formatted_line, up to 16 levels deep.
+_TAB_CACHE = tuple('\t' * tab_level for tab_level in range(17))
+
+
 def deduplicate(haystack: str, needle: str):
-    # From: https://stackoverflow.com/questions/42216559/fastest-way-to-deduplicate-contiguous-characters-in-string-python
-    if haystack.find(needle * 2) != -1:
-        return deduplicate(haystack.replace(needle * 2, needle), needle)
+    # Collapse every run of 2 or more needles into a single needle, e.g. 'a//b///c' ->
+    # 'a/b/c' for needle='/'. One regex pass replaces every run rather than replacing
+    # pairs over and over. The needle is grouped so runs of multi-character needles,
+    # e.g. 'abab', are collapsed too.
+    # Originally from: https://stackoverflow.com/questions/42216559/fastest-way-to-deduplicate-contiguous-characters-in-string-python
+    compiled = _DEDUPLICATE_PATTERNS.get(needle)
+    if compiled is None:
+        compiled = (re.compile(f'(?:{re.escape(needle)}){{2,}}'), needle.replace('\\', '\\\\'))
+        _DEDUPLICATE_PATTERNS[needle] = compiled
 
-    return haystack
+    pattern, replacement = compiled
+    return pattern.sub(replacement, haystack)
 
 
 def formatted_line(info: str, tab_level: int = 1) -> str:
 
-    tabs = tab_level * '\t'
+    # The common indentation levels come from _TAB_CACHE rather than being built on
+    # every call.
+    if 0 <= tab_level < len(_TAB_CACHE):
+        tabs = _TAB_CACHE[tab_level]
+    else:
+        tabs = tab_level * '\t'
+
     return f'{tabs}{info}\n'